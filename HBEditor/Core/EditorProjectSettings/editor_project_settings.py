@@ -29,7 +29,8 @@ class EditorProjectSettings(EditorBase):
         # Read this data in first as the U.I will need it to initialize properly
         self.project_settings = Reader.ReadAll(self.file_path)
         self.project_settings_schema = Reader.ReadAll(
-            Settings.getInstance().ConvertPartialToAbsolutePath("Config/ProjectSettingsSchema.yaml")
+            Settings.getInstance().ConvertPartialToAbsolutePath("Config/ProjectSettingsSchema.yaml"),
+            Settings.getInstance().data_cache_dir
         )
 
         self.editor_ui = EditorProjectSettingsUI(self)
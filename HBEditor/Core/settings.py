@@ -15,7 +15,7 @@
 import os
 from PyQt5 import QtGui
 from HBEditor.Core.DataTypes.file_types import FileType
-from Tools.HBYaml.hb_yaml import Reader
+from Tools.HBYaml.hb_yaml import Reader, GetUserCacheDir
 
 
 class Settings:
@@ -47,6 +47,10 @@ class Settings:
         self.editor_temp_root = f"{self.editor_root}/Temp"
         self.temp_history_path = f"{self.editor_temp_root}/history.yaml"
 
+        # Parsed editor data files are cached here in binary form, so they only need to be parsed when they change.
+        # The cache is kept per-user rather than in the source tree, as its entries are unpickled when loaded
+        self.data_cache_dir = GetUserCacheDir()
+
         self.project_file = ".heartbeat"
         self.project_folder_structure = [
             "Content",
@@ -87,21 +91,24 @@ class Settings:
 
     def LoadProjectSettings(self):
         """ Reads the 'Game.yaml' file for the active project """
-        self.user_project_data = Reader.ReadAll(self.user_project_dir + "/" + self.project_default_files['Config'])
+        self.user_project_data = Reader.ReadAll(
+            self.user_project_dir + "/" + self.project_default_files['Config'],
+            self.data_cache_dir
+        )
 
     def LoadActionDatabase(self, data_path):
         """ Reads in the 'ActionsDatabase.yaml' file """
-        self.action_database = Reader.ReadAll(data_path)
+        self.action_database = Reader.ReadAll(data_path, self.data_cache_dir)
 
     def LoadEditorSettings(self, data_path):
         """ Reads in the main editor settings """
-        self.editor_data = Reader.ReadAll(data_path)
+        self.editor_data = Reader.ReadAll(data_path, self.data_cache_dir)
 
     def LoadStyleSettings(self, data_path):
         """ Load the editor style settings """
         #@TODO: Investigate QPalette use
 
-        self.style_data = Reader.ReadAll(data_path)
+        self.style_data = Reader.ReadAll(data_path, self.data_cache_dir)
 
         # Text and Font
         self.header_1_font = QtGui.QFont(self.style_data["EditorTextSettings"]["header_1_font"],self.style_data["EditorTextSettings"]["header_1_text_size"],)
@@ -12,7 +12,94 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
+import copy
+from HBEngine.Core.settings import Settings
+
+
+class ProjectSetting:
+    """ A parameter default that is read from the project settings when action data is resolved """
+    def __init__(self, section, setting):
+        self.section = section
+        self.setting = setting
+
+    def Resolve(self):
+        return Settings.getInstance().project_settings[self.section][self.setting]
+
+
+class ParameterBlock:
+    """
+    The defaults and overrides for a block of parameters. Defaults are used for parameters that aren't provided, while
+    overrides are always used. Values can be a 'ProjectSetting', or a nested 'ParameterBlock' for child blocks (Such as
+    the 'dialogue' block of the 'dialogue' action). Child blocks are only resolved if they're provided, and lists of
+    child blocks have each item resolved
+    """
+    def __init__(self, defaults=None, overrides=None):
+        self.defaults = defaults or {}
+        self.overrides = overrides or {}
+
+    def Resolve(self, data) -> dict:
+        """ Return a copy of the provided data with all defaults and overrides applied """
+        resolved_data = dict(data)
+
+        for name, value in self.defaults.items():
+            if isinstance(value, ParameterBlock):
+                if name in resolved_data:
+                    resolved_data[name] = value.ResolveBlock(resolved_data[name])
+            elif name not in resolved_data:
+                resolved_data[name] = self.ResolveValue(value)
+
+        for name, value in self.overrides.items():
+            resolved_data[name] = self.ResolveValue(value)
+
+        return resolved_data
+
+    def ResolveBlock(self, data):
+        """ Resolve the provided child block, or each child block if provided a list of them """
+        if isinstance(data, (list, tuple)):
+            return [self.Resolve(item) for item in data]
+        return self.Resolve(data)
+
+    def ResolveValue(self, value):
+        """ Returns the final value of a default or override. Values are copied so they're never shared """
+        if isinstance(value, ProjectSetting):
+            value = value.Resolve()
+        return copy.deepcopy(value)
+
+
+class FrozenData(dict):
+    """
+    A read-only dict. Action data is frozen once resolved, so actions can't modify data that is shared with the scene
+    (Which would otherwise leak into any later runs of the same action)
+    """
+    def ReadOnly(self, *args, **kwargs):
+        raise TypeError("Action data is read-only. Make a copy before modifying it")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = ReadOnly
+
+    @staticmethod
+    def Freeze(data):
+        """ Return a read-only copy of the provided data. Dicts are frozen, and lists are converted to tuples """
+        if isinstance(data, FrozenData):
+            return data
+        elif isinstance(data, dict):
+            return FrozenData({key: FrozenData.Freeze(value) for key, value in data.items()})
+        elif isinstance(data, (list, tuple)):
+            return tuple(FrozenData.Freeze(value) for value in data)
+        return data
+
+
+class ResolvedActionData(FrozenData):
+    """ Frozen action data that has had its defaults and overrides applied, and can be performed as-is """
+    pass
+
+
 class Action():
+    # Values used for parameters that aren't provided in the action data, and values that are always used regardless.
+    # These are applied once when the action data is resolved (Usually when the scene is loaded), so 'Start' can read
+    # the action data without needing to check for missing parameters. See 'ParameterBlock' for the supported values
+    defaults = {}
+    overrides = {}
+
     def __init__(self, scene, action_data, a_manager):
         self.scene = scene
         self.action_data = action_data
@@ -23,6 +110,14 @@ class Action():
         self.complete = False
         self.complete_delegate = None  # Called by the action manager before it deletes the action
 
+    @classmethod
+    def ResolveParams(cls, action_data) -> dict:
+        """
+        Return a copy of the provided action data with all defaults and overrides applied. Actions with parameters
+        that are derived from other parameters can extend this
+        """
+        return ParameterBlock(cls.defaults, cls.overrides).Resolve(action_data)
+
     def Start(self):
         pass
 
@@ -32,10 +127,16 @@ class Action():
     def Skip(self):
         pass
 
+    def Wake(self, event):
+        """
+        Called when the action is woken after sleeping (See 'ActionManager.Sleep'). 'event' is the event that woke
+        the action, or None if its deadline passed. The action is updated each frame again afterwards, unless it
+        completes or goes back to sleep
+        """
+        pass
+
     def Complete(self):
         self.complete = True
 
-    #@TODO: Create 'ValidateParams' function to handle checking for parameters in action data, and using global default
-    #@TODO: if none are provided
-    def ValidateParams(self):
-        pass
\ No newline at end of file
+        # Sleeping actions aren't updated, so make sure the action manager gets the chance to close this one
+        self.a_manager.Resume(self)
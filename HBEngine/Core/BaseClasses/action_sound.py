@@ -12,11 +12,48 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
+import pygame
+from HBEngine.Core.settings import Settings
 from HBEngine.Core.BaseClasses.action import Action
 
 
 class SoundAction(Action):
+    """
+    The base class for actions that play audio. Sound actions sleep while their audio plays, and are woken by the end
+    event pygame posts once it finishes, instead of checking whether it's still playing each frame
+
+    Each mixer channel is assigned its own end event type, so the event identifies which channel finished
+
+    End events arrive in real time, so headless runs time audio using its length on the simulated clock instead. This
+    keeps headless runs reproducible regardless of how fast they run
+    """
     # @TODO: Add Pause function
     def __init__(self, scene, action_data, a_manager):
         super().__init__(scene, action_data, a_manager)
         self.assigned_channel = None
+
+    def SleepUntilFinished(self, end_event, length):
+        """
+        Sleep until the audio finishes playing. In headless runs, the action is instead woken (Without an event) once
+        'length' seconds of simulated time have passed. A length of None sleeps until the action is completed
+        """
+        if Settings.getInstance().headless:
+            self.a_manager.Sleep(self, length)
+        else:
+            self.a_manager.SleepUntilEvent(self, end_event)
+
+    @staticmethod
+    def AssignChannelEndEvents():
+        """ Assign an end event type to each mixer channel that doesn't have one yet """
+        for index in range(pygame.mixer.get_num_channels()):
+            channel = pygame.mixer.Channel(index)
+            if channel.get_endevent() == pygame.NOEVENT:
+                channel.set_endevent(pygame.event.custom_type())
+
+    @staticmethod
+    def GetMusicEndEvent() -> int:
+        """ Returns the event type posted when the music stream stops, assigning one if it doesn't have one yet """
+        if pygame.mixer.music.get_endevent() == pygame.NOEVENT:
+            pygame.mixer.music.set_endevent(pygame.event.custom_type())
+
+        return pygame.mixer.music.get_endevent()
@@ -32,7 +32,7 @@ class Button(Interactable):
             self.renderable_data
         )
         button_text_renderable.key = f"{self.renderable_data['key']}_Text"
-        self.children.append(button_text_renderable)
+        self.AddChild(button_text_renderable)
         self.scene.active_renderables.Add(button_text_renderable)
 
     def GetText(self):
@@ -13,7 +13,7 @@
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
 import pygame
-from HBEngine.Core.settings import Settings
+from HBEngine.Core.asset_cache import AssetCache
 from HBEngine.Core.DataTypes.input_states import State
 from HBEngine.Core.BaseClasses.renderable_sprite import SpriteRenderable
 
@@ -35,8 +35,10 @@ class Interactable(SpriteRenderable):
 
         self.state = State.normal
 
-        # Track whether the previous input frame was clicking to determine whether this interactable was clicked
-        self.isClicking = False
+        # Mouse input is handled by the scene's 'HitTestService', which only informs the topmost interactable under
+        # the mouse. With 'hit_mask' enabled, a mask of the active surface is cached for pixel-accurate hit tests
+        self.hit_mask = None
+        self.hit_mask_surface = None
 
         # Interactable state surfaces
         self.hover_surface = None
@@ -53,33 +55,41 @@ class Interactable(SpriteRenderable):
         # Defer the resize until we're able to define the interactive surfaces
         self.RecalculateSize(self.scene.resolution_multiplier)
 
-    def update(self, *args):
-        super().update()
-
-        # If being hovered...
-        if self.rect.collidepoint(pygame.mouse.get_pos()):
-            # If not already in the hover state...
-            if self.state is State.normal:
-                self.SetActiveSurface(self.GetStateSurface(State.hover))
-                self.state = State.hover
-                self.scene.Draw()
-            else:  # Track whether the user has released their cursor over the sprite
-                if pygame.mouse.get_pressed()[0] == 1:
-                    # Begin the click
-                    self.isClicking = True
-                elif pygame.mouse.get_pressed()[0] == 0 and self.isClicking is True:
-                    # User has clicked this renderable
-                    self.Interact()
-                    self.isClicking = False
-                elif self.isClicking is True:
-                    # End the click
-                    self.isClicking = False
-
-        # If no longer hovering...
-        elif self.state is State.hover:
+    def SetHovered(self, hovered):
+        """ Switch between the hover and normal states. Called by the scene's 'HitTestService' """
+        if hovered and self.state is State.normal:
+            self.SetActiveSurface(self.GetStateSurface(State.hover))
+            self.state = State.hover
+            self.scene.RequestDraw()
+        elif not hovered and self.state is State.hover:
             self.SetActiveSurface(self.GetStateSurface(State.normal))
             self.state = State.normal
-            self.scene.Draw()
+            self.scene.RequestDraw()
+
+    def HitTestPixel(self, pos) -> bool:
+        """
+        Returns whether the provided screen position, which is already known to be within the rect, hits this
+        interactable. If 'hit_mask' is enabled, transparent pixels of the active surface don't count as hits
+        """
+        if not self.renderable_data.get("hit_mask", False):
+            return True
+
+        # The mask is rebuilt whenever the active surface changes (Such as when switching states)
+        surface = self.GetSurface()
+        if self.hit_mask_surface is not surface:
+            self.hit_mask = pygame.mask.from_surface(surface)
+            self.hit_mask_surface = surface
+
+        return bool(self.hit_mask.get_at((int(pos[0]) - self.rect.x, int(pos[1]) - self.rect.y)))
+
+    def UpdateRect(self, new_pos, new_size):
+        super().UpdateRect(new_pos, new_size)
+
+        # Keep the hit test index in line with the new rect
+        self.scene.hit_test.Add(self)
+
+    def OnRemove(self):
+        self.scene.hit_test.Remove(self)
 
     def RecalculateSize(self, multiplier):
         # Call the parent function to recalculate the base surface
@@ -118,12 +128,10 @@ class Interactable(SpriteRenderable):
         due to the speed at which they are requested when the user spams the hover or click events
         """
         state_missing_warning = " - Defaulting the state to use the 'Normal' sprite"
-        hover_sprite = Settings.getInstance().ConvertPartialToAbsolutePath(self.renderable_data["sprite_hover"])
-        clicked_sprite = Settings.getInstance().ConvertPartialToAbsolutePath(self.renderable_data["sprite_clicked"])
 
         if "sprite_hover" in self.renderable_data:
             if self.renderable_data['sprite_hover'] != "":
-                self.hover_surface = pygame.image.load(hover_sprite).convert_alpha()
+                self.hover_surface = AssetCache.getInstance().GetImage(self.renderable_data['sprite_hover'])
             else:
                 print("No hover sprite specified" + state_missing_warning)
                 self.hover_surface = self.surface
@@ -133,7 +141,7 @@ class Interactable(SpriteRenderable):
 
         if 'sprite_clicked' in self.renderable_data:
             if self.renderable_data["sprite_clicked"] != "":
-                self.clicked_surface = pygame.image.load(clicked_sprite).convert_alpha()
+                self.clicked_surface = AssetCache.getInstance().GetImage(self.renderable_data['sprite_clicked'])
             else:
                 print("No clicked sprite specified" + state_missing_warning)
                 self.clicked_surface = self.surface
@@ -169,17 +177,19 @@ class Interactable(SpriteRenderable):
         # the active surface
 
         if self.scaled_original_surface:
-            self.scaled_original_surface = pygame.transform.flip(self.scaled_original_surface, True, False)
+            self.scaled_original_surface = AssetCache.getInstance().GetFlippedImage(self.scaled_original_surface)
         else:
-            self.original_surface = pygame.transform.flip(self.original_surface, True, False)
+            self.original_surface = AssetCache.getInstance().GetFlippedImage(self.original_surface)
 
         # Flip the interactive surfaces along with the base surface
         if self.scaled_hover_surface:
-            self.scaled_hover_surface = pygame.transform.flip(self.scaled_hover_surface, True, False)
+            self.scaled_hover_surface = AssetCache.getInstance().GetFlippedImage(self.scaled_hover_surface)
         else:
-            self.hover_surface = pygame.transform.flip(self.hover_surface, True, False)
+            self.hover_surface = AssetCache.getInstance().GetFlippedImage(self.hover_surface)
 
         if self.scaled_clicked_surface:
-            self.scaled_clicked_surface = pygame.transform.flip(self.scaled_clicked_surface, True, False)
+            self.scaled_clicked_surface = AssetCache.getInstance().GetFlippedImage(self.scaled_clicked_surface)
         else:
-            self.clicked_surface = pygame.transform.flip(self.clicked_surface, True, False)
+            self.clicked_surface = AssetCache.getInstance().GetFlippedImage(self.clicked_surface)
+
+        self.MarkDirty()
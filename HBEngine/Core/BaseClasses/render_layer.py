@@ -0,0 +1,55 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import pygame
+
+
+class RenderLayer:
+    """
+    A named band of z-orders in a scene (Such as the background, or the interface). Each layer caches the composited
+    scene up to and including itself, so redrawing an area only requires recompositing the layers that changed there,
+    starting from the cache of the layer beneath them
+
+    Cached areas become stale whenever a renderable drawn in this layer, or in any layer beneath it, changes. Stale
+    areas are tracked per layer, and are refreshed the next time they're recomposited
+    """
+    def __init__(self, name, min_z_order):
+        self.name = name
+        self.min_z_order = min_z_order  # The lowest z-order in this layer. 'None' for the bottom layer
+        self.surface = None  # The cached composite. Created on first use, as it needs to match the window
+        self.stale_rects = []
+
+    def Prepare(self, size):
+        """ Ensure the cache matches the provided window size. A new cache is entirely stale """
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size).convert()
+            self.stale_rects = [self.surface.get_rect()]
+
+    def MarkStale(self, rect):
+        """ Flag the provided screen area of the cache as out of date """
+        rect = pygame.Rect(rect)
+        if not any(stale_rect.contains(rect) for stale_rect in self.stale_rects):
+            self.stale_rects.append(rect)
+
+    def IsStale(self, region) -> bool:
+        """ Returns whether any part of the provided screen area is out of date in the cache """
+        return region.collidelist(self.stale_rects) != -1
+
+    def Store(self, source, region):
+        """
+        Copy the provided region of the source surface into the cache. Stale areas that fall entirely within the region
+        are now up to date
+        """
+        self.surface.blit(source, region, region)
+        self.stale_rects = [rect for rect in self.stale_rects if not region.contains(rect)]
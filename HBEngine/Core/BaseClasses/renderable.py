@@ -13,6 +13,7 @@
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
 import pygame
+from HBEngine.Core.asset_cache import AssetCache
 
 
 class Renderable(pygame.sprite.Sprite):
@@ -32,15 +33,19 @@ class Renderable(pygame.sprite.Sprite):
         self.scene = scene
 
         self.rect = None
-        self.visible = True  # Allow objects to skip the draw step, but remain in the render stack
+        self._visible = True  # Allow objects to skip the draw step, but remain in the render stack
         self.surface = None  # The active surface
         self.scaled_surface = None  # The active surface used in resolutions different from the main resolution
 
-        # YAML Parameters
-        self.renderable_data = renderable_data
+        # Surfaces may be shared with other renderables (See 'AssetCache'), so they're copied before being modified.
+        # This tracks the copy this renderable owns, if any
+        self.owned_surface = None
+
+        # YAML Parameters. The data is copied, as renderables may add to it, and the source data is read-only
+        self.renderable_data = dict(renderable_data)
         self.position = self.renderable_data['position']
         self.center_align = self.renderable_data['center_align']
-        self.z_order = self.renderable_data['z_order']
+        self._z_order = self.renderable_data['z_order']
         # self.flipped = False
 
         # For indentification in the rendering stack, allow all renderables the ability be to assigned
@@ -52,6 +57,67 @@ class Renderable(pygame.sprite.Sprite):
         # Renderables can have any number of associated objects. This allows renderables to be deleted or moved as
         # a group. Since the children are drawn like regular renderables, they're independent of the rect of the parent
         self.children = []
+        self.parent = None
+
+        # Containers may draw their children as a single cached surface instead (See 'Container')
+        self.cache_composite = False
+
+    @property
+    def visible(self):
+        return self._visible
+
+    @visible.setter
+    def visible(self, value):
+        # Toggling visibility changes what is shown in this renderable's area, so it needs to be recomposited
+        if value != self._visible:
+            self._visible = value
+            self.MarkDirty()
+
+    @property
+    def z_order(self):
+        return self._z_order
+
+    @z_order.setter
+    def z_order(self, value):
+        # The owning scene keeps its renderables sorted by z-order, so it needs to know when that changes
+        if value != self._z_order:
+            self._z_order = value
+            self.scene.active_renderables.UpdateZOrder(self)
+
+    def MarkDirty(self):
+        """
+        Inform the owning scene that the area covered by this renderable needs to be recomposited. If this renderable
+        is drawn as part of a cached composite, the composite is invalidated instead
+        """
+        composite_owner = self.GetCompositeOwner()
+        if composite_owner is not None:
+            composite_owner.InvalidateComposite()
+        elif self.rect:
+            self.scene.MarkDirty(self.rect, self)
+
+    def OnRemove(self):
+        """ Called by the renderable group when this renderable is removed from the scene """
+        pass
+
+    def AddChild(self, child):
+        """ Associate the provided renderable with this one as a child """
+        child.parent = self
+        self.children.append(child)
+        child.MarkDirty()
+
+    def GetCompositeOwner(self):
+        """
+        Returns the outermost ancestor that draws this renderable as part of its cached composite, or None if this
+        renderable is drawn by the scene directly
+        """
+        composite_owner = None
+        parent = self.parent
+        while parent is not None:
+            if parent.cache_composite:
+                composite_owner = parent
+            parent = parent.parent
+
+        return composite_owner
 
     def RecalculateSize(self, multiplier):
         """ Resize the renderable and it's surfaces based on the provided size multiplier """
@@ -90,8 +156,8 @@ class Renderable(pygame.sprite.Sprite):
                     round(height * multiplier[1])
                 ]
             )
-            # Generate the scaled surface
-            scaled_surface = pygame.transform.smoothscale(surface, new_size)
+            # Generate the scaled surface. Renderables sharing the same image at the same size share the scaled surface
+            scaled_surface = AssetCache.getInstance().GetScaledImage(surface, new_size)
             new_position = self.ConvertNormToScreen(tuple(self.position))
 
             if self.center_align:
@@ -113,10 +179,13 @@ class Renderable(pygame.sprite.Sprite):
 
     def UpdateRect(self, new_pos, new_size):
         """ Sets the rect location to the provided X and Y"""
+        # Both the area we're leaving and the area we're moving to need to be recomposited
+        self.MarkDirty()
         self.rect.x = new_pos[0]
         self.rect.y = new_pos[1]
         self.rect.w = new_size[0]
         self.rect.h = new_size[1]
+        self.MarkDirty()
 
     def GetActiveSurface(self):
         """
@@ -135,6 +204,24 @@ class Renderable(pygame.sprite.Sprite):
         else:
             self.surface = surface
 
+        self.MarkDirty()
+
+    def SetAlpha(self, alpha):
+        """
+        Updates the opacity of the active surface. If the surface may be shared, a private copy is made first. Values
+        are clamped to 0-255, and values that don't change the opacity are ignored
+        """
+        alpha = max(0, min(255, int(alpha)))
+
+        if self.GetActiveSurface() is not self.owned_surface:
+            self.SetActiveSurface(self.GetActiveSurface().copy())
+            self.owned_surface = self.GetActiveSurface()
+        elif self.owned_surface.get_alpha() == alpha:
+            return
+
+        self.owned_surface.set_alpha(alpha)
+        self.scene.MarkOpacityChanged(self)
+
     def ConvertNormToScreen(self, norm_value):
         """ Take the normalized object pos and convert it to absolute screen space coordinates """
         screen_size = pygame.display.get_surface().get_size()
@@ -159,7 +246,9 @@ class Renderable(pygame.sprite.Sprite):
     def Flip(self):
         """ Flips the sprite horizontally. Chooses between the unscaled and scaled surface """
         if self.scaled_surface:
-            self.scaled_surface = pygame.transform.flip(self.scaled_surface, True, False)
+            self.scaled_surface = AssetCache.getInstance().GetFlippedImage(self.scaled_surface)
         else:
-            self.surface = pygame.transform.flip(self.surface, True, False)
+            self.surface = AssetCache.getInstance().GetFlippedImage(self.surface)
+
+        self.MarkDirty()
 
@@ -0,0 +1,75 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import pygame
+from HBEngine.Core.BaseClasses.renderable import Renderable
+
+
+class ColorRenderable(Renderable):
+    """
+    The Color Renderable class is a renderable filled with a single, solid color. This is used for color overlays,
+    such as fading a scene from black
+
+    The surface has no per-pixel alpha, so changing its opacity only changes the surface-wide alpha, and drawing it is
+    a single blend. When no size is provided, the renderable covers the entire window
+    """
+    def __init__(self, scene, renderable_data):
+        super().__init__(scene, renderable_data)
+
+        self.color = tuple(self.renderable_data["color"])
+
+        # Size is expected as screen space values at the main resolution. Without one, cover the entire window
+        if "size" in self.renderable_data:
+            self.size = self.renderable_data["size"]
+        else:
+            self.size = self.ConvertNormToScreen((1, 1))
+            if self.scene.resolution_multiplier != 1:
+                self.size = (
+                    self.size[0] / self.scene.resolution_multiplier[0],
+                    self.size[1] / self.scene.resolution_multiplier[1]
+                )
+
+        self.surface = self.CreateFill(self.size, 255)
+        self.rect = self.surface.get_rect()
+
+        # For new objects, resize initially in case we're already using a scaled resolution
+        self.RecalculateSize(self.scene.resolution_multiplier)
+
+    def CreateFill(self, size, alpha) -> pygame.Surface:
+        """ Returns a new surface of the provided size and opacity, filled with this renderable's color """
+        surface = pygame.Surface((round(size[0]), round(size[1]))).convert()
+        surface.fill(self.color)
+        surface.set_alpha(alpha)
+
+        return surface
+
+    def RecalculateSize(self, multiplier):
+        """
+        Solid fills don't need to be resampled when scaled, so a new fill of the scaled size replaces the surface
+        instead. The fill is unique to this renderable, so it can be modified directly
+        """
+        if multiplier == 1:
+            size = self.size
+        else:
+            size = (self.size[0] * multiplier[0], self.size[1] * multiplier[1])
+
+        self.surface = self.CreateFill(size, self.surface.get_alpha())
+        self.scaled_surface = None
+        self.owned_surface = self.surface
+
+        new_position = self.ConvertNormToScreen(tuple(self.position))
+        if self.center_align:
+            new_position = self.GetCenterOffset(new_position, self.surface.get_size())
+
+        self.UpdateRect(new_position, self.surface.get_size())
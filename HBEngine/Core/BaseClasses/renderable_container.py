@@ -12,21 +12,33 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
+import pygame
 from HBEngine.Core.BaseClasses.renderable import Renderable
 
 
 class Container(Renderable):
+    """
+    Containers group renderables together, allowing them to be created and removed as a single unit. Containers have
+    no surface of their own, and their children are drawn by the scene
+
+    If 'cache_composite' is enabled, the children are instead drawn into a single cached surface, which the scene draws
+    in one blit. The cache is rebuilt whenever a child changes (Such as a button being hovered), so this suits
+    containers that are mostly idle, like menus and choice lists
+    """
     def __init__(self, scene, renderable_data):
         super().__init__(scene, renderable_data)
         self.visible = False
 
+        self.cache_composite = self.renderable_data.get("cache_composite", False)
+        self.composite = None  # Built the first time it's drawn after being invalidated
+
         #@TODO: Minimize the specific references to objects here so that containers can be more generalized
         # Load any specified objects (Non-interactables)
         if 'sprites' in renderable_data:
             f_objects = renderable_data['sprites']
 
             for f_object in f_objects:
-                self.children.append(self.scene.a_manager.PerformAction(f_object, 'create_sprite'))
+                self.AddChild(self.scene.a_manager.PerformAction(f_object, 'create_sprite'))
         else:
             print('Data file does not specify any sprites')
 
@@ -35,7 +47,7 @@ class Container(Renderable):
             f_interactables = renderable_data['interactables']
 
             for f_interactable in f_interactables:
-                self.children.append(self.scene.a_manager.PerformAction(f_interactable, 'create_interactable'))
+                self.AddChild(self.scene.a_manager.PerformAction(f_interactable, 'create_interactable'))
         else:
             print('Data file does not specify any interactables')
 
@@ -44,7 +56,7 @@ class Container(Renderable):
             f_buttons = renderable_data['buttons']
 
             for f_button in f_buttons:
-                self.children.append(self.scene.a_manager.PerformAction(f_button, 'create_button'))
+                self.AddChild(self.scene.a_manager.PerformAction(f_button, 'create_button'))
         else:
             print('Data file does not specify any buttons')
 
@@ -53,12 +65,19 @@ class Container(Renderable):
             f_texts = renderable_data['text']
 
             for f_text in f_texts:
-                self.children.append(self.scene.a_manager.PerformAction(f_text, 'create_text'))
+                self.AddChild(self.scene.a_manager.PerformAction(f_text, 'create_text'))
         else:
             print('Data file does not specify any text')
 
+        # A cached composite is drawn in place of the children, so the container needs to be visible
+        if self.cache_composite:
+            self.visible = True
+
     def GetAllChildren(self) -> list:
         """ Recursively collect all children to this container """
+        if not self.children:
+            return []
+
         f_children = []
         return self.GetChild(self, f_children)
 
@@ -77,3 +96,96 @@ class Container(Renderable):
             return f_children
         else:
             return parent
+
+    def GetSurface(self):
+        """ If caching is enabled, returns the cached composite of the children, rebuilding it if it's out of date """
+        if not self.cache_composite:
+            return super().GetSurface()
+
+        if self.composite is None:
+            self.composite = self.BuildComposite()
+
+        return self.composite
+
+    def GetActiveSurface(self):
+        if not self.cache_composite:
+            return super().GetActiveSurface()
+
+        return self.GetSurface()
+
+    def InvalidateComposite(self):
+        """
+        Discard the cached composite so it's rebuilt the next time it's drawn. The area covered by the children may
+        have changed, so the container's rect is updated to match, and the z-order is raised to that of the highest
+        child so the composite is drawn in its place
+        """
+        self.composite = None
+
+        descendants = self.GetCompositedChildren()
+        if descendants:
+            self.z_order = max(child.z_order for child in descendants)
+
+        bounds = self.GetCompositeBounds(descendants)
+        if self.rect is None:
+            self.rect = bounds
+            self.MarkDirty()
+        elif bounds != self.rect:
+            self.UpdateRect(bounds.topleft, bounds.size)
+        else:
+            self.MarkDirty()
+
+    def GetCompositedChildren(self) -> list:
+        """
+        Returns every renderable drawn in the composite, ordered by z-order. Nested containers have no surface of
+        their own, so only their children are included
+        """
+        return sorted(
+            (child for child in self.GetAllChildren() if not isinstance(child, Container)),
+            key=lambda child: child.z_order
+        )
+
+    def GetCompositeBounds(self, descendants) -> pygame.Rect:
+        """ Returns the screen area covered by the provided renderables """
+        rects = [child.rect for child in descendants if child.rect]
+        if not rects:
+            return pygame.Rect(0, 0, 0, 0)
+
+        return rects[0].unionall(rects[1:])
+
+    def BuildComposite(self) -> pygame.Surface:
+        """ Draw the children into a new surface covering the container's rect """
+        composite = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        for child in self.GetCompositedChildren():
+            if child.visible and child.rect:
+                composite.blit(child.GetSurface(), (child.rect.x - self.rect.x, child.rect.y - self.rect.y))
+
+        return composite
+
+    def Flatten(self) -> list:
+        """
+        Replace the children with a static copy of their composite, so the container can be treated as a single
+        renderable (Such as for a transition). The children are detached, and returned so they can be removed
+        """
+        children = self.GetAllChildren()
+        if not self.cache_composite:
+            self.cache_composite = True
+            self.InvalidateComposite()
+
+        self.surface = self.GetSurface()
+        self.owned_surface = self.surface
+        self.cache_composite = False
+        self.composite = None
+
+        for child in children:
+            child.parent = None
+        self.children = []
+
+        self.visible = True
+        self.MarkDirty()
+
+        return children
+
+    def RecalculateSize(self, multiplier):
+        """ Containers have no surface to resize. Their children are resized individually by the scene """
+        if self.cache_composite:
+            self.InvalidateComposite()
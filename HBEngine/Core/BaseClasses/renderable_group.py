@@ -12,6 +12,9 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
+from bisect import bisect_left, bisect_right
+
+
 class RenderableGroup():
     def __init__(self):
         """
@@ -20,6 +23,14 @@ class RenderableGroup():
         """
         self.renderables = {}
 
+        # A persistent list of the renderables sorted by z-order (Lowest to Highest), maintained as renderables are
+        # added, removed and reordered so drawing never needs to sort. Ties are broken by insertion order. The sort
+        # keys are stored in a parallel list as (z_order, insertion_index) tuples so they can be bisected
+        self.render_order = []
+        self.sort_keys = []
+        self.sort_key_lookup = {}
+        self.insertion_count = 0
+
         super().__init__()
 
     def Add(self, *r_to_add):
@@ -30,7 +41,20 @@ class RenderableGroup():
         for renderable in r_to_add:
             if renderable.key is None:
                 print(f"Renderable has no key assigned - Removal will be impossible: {renderable}")
+
+            # If this replaces an existing renderable, the area it covered needs to be recomposited as well. The new
+            # renderable inherits the insertion position of the one it replaces
+            if renderable.key in self.renderables:
+                self.renderables[renderable.key].MarkDirty()
+                self.renderables[renderable.key].OnRemove()
+                insertion_index = self.RemoveFromRenderOrder(renderable.key)
+            else:
+                insertion_index = self.insertion_count
+                self.insertion_count += 1
+
             self.renderables[renderable.key] = renderable
+            self.InsertIntoRenderOrder(renderable, insertion_index)
+            renderable.MarkDirty()
 
     def Remove(self, *key_to_remove):
         """
@@ -38,12 +62,38 @@ class RenderableGroup():
         """
         for key in key_to_remove:
             try:
-                del self.renderables[key]
+                removed_renderable = self.renderables.pop(key)
+                removed_renderable.MarkDirty()
+                removed_renderable.OnRemove()
+                self.RemoveFromRenderOrder(key)
             except KeyError as exc:
                 print(f"Key not found: {exc}")
             except Exception as rexc:
                 print(f"Unknown error while removing: {rexc}")
 
+    def UpdateZOrder(self, renderable):
+        """ Reposition the provided renderable in the render order to account for a change in its z-order """
+        if self.renderables.get(renderable.key) is renderable:
+            insertion_index = self.RemoveFromRenderOrder(renderable.key)
+            self.InsertIntoRenderOrder(renderable, insertion_index)
+            renderable.MarkDirty()
+
+    def InsertIntoRenderOrder(self, renderable, insertion_index):
+        """ Insert the provided renderable into the sorted render order """
+        sort_key = (renderable.z_order, insertion_index)
+        index = bisect_right(self.sort_keys, sort_key)
+        self.sort_keys.insert(index, sort_key)
+        self.render_order.insert(index, renderable)
+        self.sort_key_lookup[renderable.key] = sort_key
+
+    def RemoveFromRenderOrder(self, key) -> int:
+        """ Remove the renderable using the provided key from the sorted render order. Returns its insertion index """
+        sort_key = self.sort_key_lookup.pop(key)
+        index = bisect_left(self.sort_keys, sort_key)
+        del self.sort_keys[index]
+        del self.render_order[index]
+        return sort_key[1]
+
     def Clear(self):
         pass
 
@@ -12,8 +12,7 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
-import pygame
-from HBEngine.Core.settings import Settings
+from HBEngine.Core.asset_cache import AssetCache
 from HBEngine.Core.BaseClasses.renderable import Renderable
 
 
@@ -29,10 +28,9 @@ class SpriteRenderable(Renderable):
         super().__init__(scene, renderable_data)
 
         # YAML Parameters
-        sprite = Settings.getInstance().ConvertPartialToAbsolutePath(self.renderable_data['sprite'])
-
+        # Sprite surfaces are shared with any other renderable using the same image
         try:
-            self.surface = pygame.image.load(sprite).convert_alpha()
+            self.surface = AssetCache.getInstance().GetImage(self.renderable_data['sprite'])
             self.rect = self.surface.get_rect()
         except Exception as exc:
             print("Failed to load data file for Renderable - Either the file was not found, or it is not a "
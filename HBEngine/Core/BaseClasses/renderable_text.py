@@ -14,7 +14,7 @@
 """
 import pygame
 from HBEngine.Core.BaseClasses.renderable import Renderable
-from HBEngine.Core.settings import Settings
+from HBEngine.Core.asset_cache import AssetCache
 
 
 class TextRenderable(Renderable):
@@ -26,14 +26,20 @@ class TextRenderable(Renderable):
         - Pop-up text
         - etc
     """
+    # Cached word widths for each font, used to estimate where lines should wrap. Fonts are shared through the
+    # 'AssetCache', so these are shared across all text using the same font and size
+    word_metrics = {}
+    max_cached_words = 10000
+
     def __init__(self, scene, renderable_data):
         super().__init__(scene, renderable_data)
 
-        font = Settings.getInstance().ConvertPartialToAbsolutePath(self.renderable_data['font'])
         self.text = self.renderable_data["text"]
         self.text_color = self.renderable_data["text_color"]
         text_size = self.renderable_data["text_size"]
-        self.font_obj = pygame.font.Font(font, text_size)
+
+        # Font objects are shared with any other text using the same font and size
+        self.font_obj = AssetCache.getInstance().GetFont(self.renderable_data['font'], text_size)
 
         # If a size was passed (expected as screen space values), then use it for the wrap bounds
         if "size" not in self.renderable_data:
@@ -53,6 +59,9 @@ class TextRenderable(Renderable):
         self.WrapText(self.surface)
         self.rect = self.surface.get_rect()
 
+        # Text surfaces are unique to each renderable, so they can be modified directly
+        self.owned_surface = self.surface
+
         # For new objects, resize initially in case we're already using a scaled resolution
         self.RecalculateSize(self.scene.resolution_multiplier)
 
@@ -79,19 +88,12 @@ class TextRenderable(Renderable):
 
             processing_complete = False
             while not processing_complete:
-                i = 1
-
                 # Determine if the text will exceed the bounds height
                 if base_top + font_height > rect.bottom:
                     break
 
-                # Parse the text until we've exceeded horizontal bounds, or we reached the end of the string
-                while self.font_obj.size(line[:i])[0] < rect.width and i < len(line):
-                    i += 1
-
-                # If we didn't reach the end of the string, grab the last occurrence of a whitespace
-                if i < len(line):
-                    i = line.rfind(" ", 0, i) + 1
+                # Find how much of the text fits within the horizontal bounds
+                i = self.FindLineBreak(line, rect.width)
 
                 # Render the line and blit it to the surface
                 image = self.font_obj.render(line[:i], True, self.text_color)
@@ -113,4 +115,72 @@ class TextRenderable(Renderable):
                 if not line:
                     processing_complete = True
 
-
+    def FindLineBreak(self, line, max_width) -> int:
+        """
+        Returns the index at which the provided line should be broken to fit within the provided width. Lines are
+        broken after the last whitespace that fits. If no whitespace fits, the line is broken after the last
+        character that fits instead
+
+        Word widths are estimated using cached per-font metrics to find a likely break, which is then corrected using
+        exact measurements. This usually only requires a couple of measurements per line
+        """
+        word_widths = TextRenderable.word_metrics.setdefault(self.font_obj, {})
+        if len(word_widths) > TextRenderable.max_cached_words:
+            word_widths.clear()
+        if " " not in word_widths:
+            word_widths[" "] = self.font_obj.size(" ")[0]
+
+        # Estimate the last whitespace that fits by summing the width of each word before it. Words are extracted one
+        # at a time so only the part of the line that is examined gets processed
+        break_index = -1
+        estimated_width = 0
+        word_start = 0
+        while word_start <= len(line):
+            word_end = line.find(" ", word_start)
+            if word_end == -1:
+                break
+
+            word = line[word_start:word_end]
+            if word not in word_widths:
+                word_widths[word] = self.font_obj.size(word)[0]
+
+            estimated_width += word_widths[word]
+            if estimated_width >= max_width:
+                break
+
+            break_index = word_end
+            estimated_width += word_widths[" "]
+            word_start = word_end + 1
+
+        # Correct the estimate, as the combined width of words can differ from their individual widths (Kerning, etc).
+        # Step back while the break doesn't fit, then step forward while the next break also fits
+        while break_index > 0 and self.font_obj.size(line[:break_index])[0] >= max_width:
+            break_index = line.rfind(" ", 0, break_index)
+
+        next_index = line.find(" ", break_index + 1)
+        while next_index != -1 and self.font_obj.size(line[:next_index])[0] < max_width:
+            break_index = next_index
+            next_index = line.find(" ", break_index + 1)
+
+        # If every whitespace fits, the rest of the line may fit as well. Like the original character-by-character
+        # scan, the final character isn't considered when checking whether the whole line fits
+        if next_index == -1 and (len(line) <= 1 or self.font_obj.size(line[:-1])[0] < max_width):
+            return len(line)
+
+        if break_index != -1:
+            return break_index + 1
+
+        # No whitespace fits, so break mid-word. Binary search for the longest prefix of the first word that fits
+        # (Always at least one character so the text keeps progressing)
+        low = 1
+        high = len(line) - 1
+        if next_index != -1:
+            high = min(high, next_index)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.font_obj.size(line[:middle])[0] < max_width:
+                low = middle
+            else:
+                high = middle - 1
+
+        return low
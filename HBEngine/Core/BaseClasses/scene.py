@@ -13,14 +13,28 @@
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
 import pygame
+import weakref
+from bisect import bisect_left
 from HBEngine.Core.settings import Settings
 from HBEngine.Core.BaseClasses.renderable_group import RenderableGroup
+from HBEngine.Core.BaseClasses.render_layer import RenderLayer
 from HBEngine.Core.action_manager import ActionManager
-from Tools.HBYaml.hb_yaml import Reader
+from HBEngine.Core.hit_test_service import HitTestService
+from HBEngine.Core.input_router import InputRouter
+from HBEngine.Core.frame_profiler import FrameProfiler
 
 
 class Scene:
-    def __init__(self, scene_data_file, window, scene_manager):
+    # The render layers of every scene as (name, lowest z-order) pairs, from bottom to top. Each renderable belongs to
+    # the highest layer whose lowest z-order doesn't exceed its own. Children are drawn in the layer of their parent
+    render_layers = (
+        ("background", None),
+        ("characters", 0),
+        ("interface", 100),
+        ("overlay", 1000)
+    )
+
+    def __init__(self, scene_data, window, scene_manager):
 
         self.window = window
         self.scene_manager = scene_manager
@@ -28,14 +42,52 @@ class Scene:
         self.active_sounds = {}
         self.active_music = None  # Only one music stream is supported. Stores a 'SoundAction'
         self.a_manager = ActionManager(self)
+        self.hit_test = HitTestService(self)
+
+        # Input is routed to the scene by the 'InputRouter'. The scene owns its subscriptions, which are removed when
+        # the scene is unloaded. Scene input is deferred until after the actions are updated (See 'DeferInput')
+        self.deferred_input = []
+        self.hit_test.Subscribe()
+        InputRouter.getInstance().SubscribeBinding("pause", pygame.KEYDOWN, self.DeferInput(self.OpenPauseMenu),
+                                                   owner=self)
 
         self.pause_menu = None
 
         # Keep track of delta time so time-based actions can be more accurate across systems
         self.delta_time = 0
 
-        # Read in the active scene data
-        self.scene_data = Reader.ReadAll(Settings.getInstance().ConvertPartialToAbsolutePath(scene_data_file))
+        # Dirty-rectangle rendering. Renderables report the screen areas they affect whenever they change, and only
+        # those areas are recomposited. Any recomposited areas are then held until the engine pushes them to the display
+        self.dirty_rects = []
+        self.update_rects = []
+        self.full_redraw = True  # The first draw of a scene always covers the entire window
+
+        # If the dirty areas cover more than this fraction of the window, recomposite the whole window instead
+        self.full_redraw_threshold = 0.6
+
+        # Each layer caches the scene composited up to and including itself, so only the layers that changed in a
+        # dirty area are recomposited. The top layer is always drawn directly, so it has no cache. 'drawn_layers' maps
+        # each renderable to the lowest layer it was drawn in as of the last draw. It's only updated for renderables
+        # that mark themselves dirty (Which they do when added, removed or reordered). Entries are weak, so removed
+        # renderables that are never marked dirty again don't linger
+        self.layers = [RenderLayer(name, min_z_order) for name, min_z_order in self.render_layers]
+        self.drawn_layers = weakref.WeakKeyDictionary()
+
+        # Drawing is coalesced to once per frame. Anything that changes the scene requests a draw, and the engine
+        # performs a single composite after all of the frame's logic has run. 'draw_count' tracks how many composites
+        # occurred in the active frame, and is reset by the engine
+        self.draw_requested = True
+        self.draw_count = 0
+
+        # Renderables whose opacity is being faded (See 'BeginFade'), mapped to a cached copy of the scene beneath them
+        # as a (rect, surface) pair. Changing the opacity of a fading renderable only requires restoring its backdrop
+        # and blending it on top, instead of recompositing everything beneath it. 'changed_fades' holds the fading
+        # renderables whose opacity changed since the last draw
+        self.fades = {}
+        self.changed_fades = set()
+
+        # The scene data is read by the scene manager, which may have parsed it ahead of time
+        self.scene_data = scene_data
 
         # Load any cached data on the scene manager
         if not self.scene_manager.resolution_multiplier:
@@ -46,34 +98,314 @@ class Scene:
         self.LoadSceneData()
 
     def Update(self, events):
+        self.hit_test.Update()
         self.active_renderables.Update()
+        FrameProfiler.getInstance().Mark("renderables")
+
         self.a_manager.Update(events)
+        FrameProfiler.getInstance().Mark("actions")
+
+        # Handle any scene input received this frame. The list is swapped out first, as handlers may switch scenes
+        deferred_input, self.deferred_input = self.deferred_input, []
+        for handler, event in deferred_input:
+            handler(event)
+
+    def DeferInput(self, handler):
+        """
+        Returns an input handler that defers the provided handler until after the scene's actions are updated, so
+        actions started by scene input get their first update on the following frame
+        """
+        return lambda event: self.deferred_input.append((handler, event))
 
-        # Pause Menu
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_p:
-                    #@TODO: TEMP HACK
-                    if self.active_renderables.Exists('Pause_Menu'):
-                        print("Pause Menu Open")
-                    else:
-                        self.pause_menu = self.a_manager.PerformAction(self.scene_manager.pause_menu_data,
-                                                                       "create_container")
+    def OpenPauseMenu(self, event):
+        """ Open the pause menu, unless it's already open """
+        #@TODO: TEMP HACK
+        if self.active_renderables.Exists('Pause_Menu'):
+            print("Pause Menu Open")
+        else:
+            self.pause_menu = self.a_manager.PerformAction(self.scene_manager.pause_menu_data, "create_container")
 
     def Draw(self):
-        # Sort the renderable elements by their z-order (Lowest to Highest)
-        renderables = sorted(self.active_renderables.renderables.values(), key=lambda renderable: renderable.z_order)
+        """
+        Recomposite any areas of the window that have been marked as dirty since the last draw. This is invoked once
+        per frame by the engine. Use 'RequestDraw' to schedule a draw instead of calling this directly
+        """
+        self.draw_requested = False
+        self.draw_count += 1
+
+        # The renderable group keeps its renderables sorted by z-order (Lowest to Highest)
+        renderables = self.active_renderables.render_order
+        layer_bounds = self.GetLayerBounds()
+
+        # Flag the dirty areas as stale in the layer caches they affect, before they're consumed
+        self.UpdateLayerCaches()
+
+        regions = self.GetDirtyRegions()
+        changed_fades = self.changed_fades
+        self.changed_fades = set()
+
+        # Stop tracking any fading renderables that have since been removed
+        for renderable in list(self.fades):
+            if self.active_renderables.renderables.get(renderable.key) is not renderable:
+                self.EndFade(renderable)
+
+        top_layer = len(self.layers) - 1
+        for region in regions:
+            # Restrict all blits to the dirty region so untouched pixels are left alone
+            self.window.set_clip(region)
 
-        # Draw any renderables using the screen space multiplier to fit the new resolution
+            # Start from the cache of the highest layer that's still up to date in this region
+            start_layer = next(
+                (index for index in range(top_layer) if self.layers[index].IsStale(region)), top_layer
+            )
+            if start_layer == 0:
+                self.window.fill((0, 0, 0), region)
+            else:
+                self.window.blit(self.layers[start_layer - 1].surface, region, region)
+
+            for index in range(start_layer, len(self.layers)):
+                self.CompositeRegion(self.window, region, renderables[layer_bounds[index]:layer_bounds[index + 1]])
+                if index < top_layer:
+                    self.layers[index].Store(self.window, region)
+
+        self.window.set_clip(None)
+        self.update_rects.extend(regions)
+
+        if self.fades:
+            self.DrawFades(regions, changed_fades, renderables)
+
+    def DrawFades(self, regions, changed_fades, renderables):
+        """
+        Keep the backdrops of fading renderables in line with any recomposited regions, then redraw the fading
+        renderables whose opacity changed. This costs a copy of the backdrop and a single blend per renderable
+        """
+        sort_keys = self.active_renderables.sort_keys
+        sort_key_lookup = self.active_renderables.sort_key_lookup
+        for renderable, backdrop in self.fades.items():
+            index = bisect_left(sort_keys, sort_key_lookup[renderable.key])
+
+            if backdrop is None or backdrop[0] != renderable.rect:
+                backdrop = (pygame.Rect(renderable.rect), pygame.Surface(renderable.rect.size).convert())
+                self.fades[renderable] = backdrop
+                self.UpdateBackdrop(backdrop, backdrop[0], renderables[:index])
+            else:
+                for region in regions:
+                    if region.colliderect(backdrop[0]):
+                        self.UpdateBackdrop(backdrop, region.clip(backdrop[0]), renderables[:index])
+
+            if renderable in changed_fades:
+                region = renderable.rect.clip(self.window.get_rect())
+                if region.w == 0 or region.h == 0:
+                    continue
+
+                # Restore the scene beneath the renderable, then draw it and anything above it on top
+                self.window.set_clip(region)
+                self.window.blit(backdrop[1], backdrop[0])
+                self.CompositeRegion(self.window, region, renderables[index:])
+                self.window.set_clip(None)
+                self.update_rects.append(region)
+
+    def UpdateBackdrop(self, backdrop, region, renderables):
+        """ Recomposite the provided screen region of a fading renderable's backdrop using the provided renderables """
+        rect, surface = backdrop
+        local_region = region.move(-rect.x, -rect.y)
+
+        surface.set_clip(local_region)
+        surface.fill((0, 0, 0), local_region)
+        self.CompositeRegion(surface, region, renderables, rect.topleft)
+        surface.set_clip(None)
+
+    def CompositeRegion(self, target, region, renderables, offset=(0, 0)):
+        """
+        Blit the provided renderables (And their children) that overlap the provided screen region onto the target
+        surface, in order. The offset is the screen position of the target's top-left corner
+        """
         for renderable in renderables:
-            if renderable.visible:
-                self.window.blit(renderable.GetSurface(), (renderable.rect.x, renderable.rect.y))
+            # Renderables in a container's cached composite are drawn as part of the container instead
+            if renderable.parent is not None and renderable.GetCompositeOwner() is not None:
+                continue
 
-            # Draw any child renderables after drawing the parent
-            if renderable.children:
+            # Draw any renderables using the screen space multiplier to fit the new resolution
+            if renderable.visible and renderable.rect.colliderect(region):
+                target.blit(renderable.GetSurface(), (renderable.rect.x - offset[0], renderable.rect.y - offset[1]))
+
+            # Draw any child renderables after drawing the parent, unless they're in the parent's cached composite
+            if renderable.children and not renderable.cache_composite:
                 for child in renderable.children:
-                    if child.visible:
-                        self.window.blit(child.GetSurface(), (child.rect.x, child.rect.y))
+                    if child.visible and child.rect.colliderect(region):
+                        target.blit(child.GetSurface(), (child.rect.x - offset[0], child.rect.y - offset[1]))
+
+    def GetLayerBounds(self) -> list:
+        """
+        Returns the index in the render order at which each layer starts, followed by the length of the render order.
+        The renderables in layer 'n' are 'render_order[bounds[n]:bounds[n + 1]]'
+        """
+        sort_keys = self.active_renderables.sort_keys
+        bounds = [0]
+        for layer in self.layers[1:]:
+            bounds.append(bisect_left(sort_keys, (layer.min_z_order,)))
+        bounds.append(len(sort_keys))
+
+        return bounds
+
+    def GetLayerIndex(self, z_order) -> int:
+        """ Returns the index of the layer that the provided z-order belongs to """
+        for index in range(len(self.layers) - 1, 0, -1):
+            if z_order >= self.layers[index].min_z_order:
+                return index
+        return 0
+
+    def UpdateLayerCaches(self):
+        """
+        Flag the pending dirty areas as stale in each layer cache they affect. An area changed by a renderable affects
+        the layer it's drawn in, and every layer above it. Areas without a renderable affect every layer
+        """
+        window_size = self.window.get_size()
+        for layer in self.layers[:-1]:
+            layer.Prepare(window_size)
+
+        if self.full_redraw:
+            self.MarkLayersStale(self.window.get_rect(), 0)
+
+        # Renderables may have moved between layers since the last draw. Either layer could hold their old pixels, so
+        # the lowest of the two is used. The previous layers are only replaced once every dirty area is flagged, as a
+        # renderable may have marked itself dirty more than once
+        drawn_layers = {}
+        for rect, renderable in self.dirty_rects:
+            if renderable is None:
+                self.MarkLayersStale(rect, 0)
+                continue
+
+            if renderable not in drawn_layers:
+                drawn_layers[renderable] = self.GetDrawnLayer(renderable)
+
+            layer_index = min(
+                self.GetLayerIndex(renderable.z_order), self.drawn_layers.get(renderable, len(self.layers))
+            )
+            if drawn_layers[renderable] is not None:
+                layer_index = min(layer_index, drawn_layers[renderable])
+            self.MarkLayersStale(rect, layer_index)
+
+        for renderable, layer_index in drawn_layers.items():
+            if layer_index is None:
+                self.drawn_layers.pop(renderable, None)
+            else:
+                self.drawn_layers[renderable] = layer_index
+
+    def GetDrawnLayer(self, renderable):
+        """
+        Returns the lowest layer the provided renderable is drawn in, or None if it isn't drawn. Renderables in the
+        scene are drawn in the layer of their z-order, and children are drawn in the layer of their parent as well
+        """
+        layer_index = None
+        if self.active_renderables.renderables.get(renderable.key) is renderable:
+            layer_index = self.GetLayerIndex(renderable.z_order)
+
+        if renderable.parent is not None:
+            parent_layer_index = self.GetDrawnLayer(renderable.parent)
+            if parent_layer_index is not None and (layer_index is None or parent_layer_index < layer_index):
+                layer_index = parent_layer_index
+
+        return layer_index
+
+    def MarkLayersStale(self, rect, layer_index):
+        """ Flag the provided screen area as stale in the cache of the provided layer, and every layer above it """
+        for layer in self.layers[layer_index:-1]:
+            layer.MarkStale(rect)
+
+    def RequestDraw(self):
+        """ Schedule a draw at the end of the active frame. Multiple requests in a single frame result in one draw """
+        self.draw_requested = True
+
+    def MarkDirty(self, rect, renderable=None):
+        """
+        Flag the provided screen area as needing to be recomposited during the next draw. If the area was changed by a
+        renderable, only the layers from the one it's drawn in upwards are recomposited
+        """
+        if rect.w > 0 and rect.h > 0:
+            self.dirty_rects.append((pygame.Rect(rect), renderable))
+            self.draw_requested = True
+
+    def MarkOpacityChanged(self, renderable):
+        """
+        Flag that only the opacity of the provided renderable has changed. Fading renderables are redrawn using their
+        cached backdrop, unless they overlap another fading renderable. Anything else is recomposited as usual
+        """
+        if renderable in self.fades and not any(
+                other is not renderable and other.rect.colliderect(renderable.rect) for other in self.fades
+        ):
+            self.changed_fades.add(renderable)
+            self.draw_requested = True
+
+            # The layer caches holding the renderable are out of date, even though the window is updated directly
+            self.MarkLayersStale(renderable.rect, min(
+                self.GetLayerIndex(renderable.z_order), self.drawn_layers.get(renderable, len(self.layers))
+            ))
+        else:
+            renderable.MarkDirty()
+
+    def BeginFade(self, renderable):
+        """
+        Cache the scene beneath the provided renderable for as long as its opacity is being changed, so that each
+        change only costs a single blend over its own area. Call 'EndFade' once the fade is finished
+        """
+        # Renderables in a cached composite are redrawn through their container instead
+        if renderable not in self.fades and renderable.GetCompositeOwner() is None:
+            self.fades[renderable] = None
+            renderable.MarkDirty()
+
+    def EndFade(self, renderable):
+        """
+        Stop caching the backdrop of the provided renderable. Any pending opacity change is recomposited as usual
+        """
+        self.fades.pop(renderable, None)
+        if renderable in self.changed_fades:
+            self.changed_fades.discard(renderable)
+            renderable.MarkDirty()
+
+    def RequestFullRedraw(self):
+        """ Flag the entire window as needing to be recomposited during the next draw """
+        self.full_redraw = True
+        self.draw_requested = True
+
+    def GetDirtyRegions(self) -> list:
+        """
+        Consume the pending dirty rects, and return them as a list of non-overlapping regions clipped to the window.
+        If the regions cover most of the window, a single region covering the whole window is returned instead
+        """
+        window_rect = self.window.get_rect()
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+
+        if self.full_redraw:
+            self.full_redraw = False
+            return [window_rect]
+
+        # Merge any overlapping rects together. Merging can cause the result to overlap with rects that were already
+        # processed, so keep going until nothing changes
+        merged = []
+        for rect, renderable in dirty_rects:
+            rect = rect.clip(window_rect)
+            if rect.w == 0 or rect.h == 0:
+                continue
+
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        dirty_area = sum(rect.w * rect.h for rect in merged)
+        if dirty_area > window_rect.w * window_rect.h * self.full_redraw_threshold:
+            return [window_rect]
+
+        return merged
+
+    def FlushUpdateRects(self) -> list:
+        """ Return the list of window areas that were recomposited since the last flush, then clear it """
+        update_rects = self.update_rects
+        self.update_rects = []
+        return update_rects
 
     def SwitchScene(self, scene_file):
         """ Clears all renderables, and requests a scene change from the scene_manager"""
@@ -97,7 +429,7 @@ class Scene:
                     child.RecalculateSize(self.resolution_multiplier)
 
         # Redraw the scaled sprites
-        self.Draw()
+        self.RequestFullRedraw()
 
     def LoadSceneData(self):
         """ Read the scene yaml file, and prepare the scene by spawning object classes, storing scene values, etc """
@@ -14,39 +14,45 @@
 """
 import pygame
 from HBEngine.Core.BaseClasses.scene_pointandclick import PointAndClickScene
+from HBEngine.Core.asset_prefetcher import AssetPrefetcher
+from HBEngine.Core.input_router import InputRouter
 
 
 class DialogueScene(PointAndClickScene):
-    def __init__(self, scene_data_file, window, scene_manager):
+    # The number of upcoming entries to prefetch assets for. Branches reachable through choices within this range
+    # have their first entries prefetched as well
+    prefetch_depth = 5
+
+    def __init__(self, scene_data, window, scene_manager):
         self.dialogue_index = 0
         self.dialogue_data = ""
         self.active_branch = "Main"
         self.character_data = {}
 
-        # Update the generic data using the parent's init
-        super().__init__(scene_data_file, window, scene_manager)
+        InputRouter.getInstance().SubscribeBinding("continue", pygame.KEYUP, self.DeferInput(self.Continue),
+                                                   owner=self)
 
-    def Update(self, events):
-        super().Update(events)
+        # Update the generic data using the parent's init
+        super().__init__(scene_data, window, scene_manager)
 
-        for event in events:
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_SPACE:
-                    # Skip the running action if its able to be skipped
-                    if self.a_manager.active_actions:
-                        for action in self.a_manager.active_actions:
-                            if action.skippable:
-                                action.Skip()
+    def Continue(self, event):
+        """ Skip the running actions if they're able to be skipped. If no actions are running, run the next one """
+        if self.a_manager.active_actions:
+            for action in self.a_manager.active_actions:
+                if action.skippable:
+                    action.Skip()
 
-                    # No actions active. Go to next
-                    else:
-                        self.LoadAction()
+        # No actions active. Go to next
+        else:
+            self.LoadAction()
 
     def LoadAction(self):
         """
         Runs the next action specified in the dialogue file. Will recurse if the action has 'wait_for_input' set
         to False
         """
+        self.PrefetchUpcomingEntries()
+
         if len(self.dialogue_data[self.active_branch]["entries"]) > self.dialogue_index:
             action_data = self.dialogue_data[self.active_branch]["entries"][self.dialogue_index]
             if "post_wait" in action_data:
@@ -68,11 +74,38 @@ class DialogueScene(PointAndClickScene):
         else:
             print('The end of available dialogue actions has been reached')
 
+    def PrefetchUpcomingEntries(self):
+        """ Load the assets for the upcoming entries in the background, so they're ready by the time they're used """
+        entries = self.dialogue_data[self.active_branch]["entries"]
+        upcoming_entries = entries[self.dialogue_index:self.dialogue_index + self.prefetch_depth]
+
+        for entry in upcoming_entries:
+            AssetPrefetcher.getInstance().PrefetchData(entry)
+
+            # Also look ahead into any branches the player may choose
+            branches = []
+            if entry.get("action") == "choice":
+                branches = [choice["branch"] for choice in entry["choices"]]
+            elif entry.get("action") == "choose_branch":
+                branches = [entry["branch"]]
+
+            for branch in branches:
+                if branch in self.dialogue_data and branch != self.active_branch:
+                    AssetPrefetcher.getInstance().PrefetchData(
+                        self.dialogue_data[branch]["entries"][:self.prefetch_depth]
+                    )
+
     def LoadSceneData(self):
         """ Load the full dialogue structure, and load the first action """
         super().LoadSceneData()
         self.dialogue_data = self.scene_data['dialogue']
 
+        # Resolve the defaults of every entry up front, so entries can be run as-is
+        for branch_data in self.dialogue_data.values():
+            branch_data["entries"] = [
+                self.a_manager.ResolveActionData(entry, entry["action"]) for entry in branch_data["entries"]
+            ]
+
         # Dialogue Scenes can read speaker files in order to prepare a variety of values for the dialogue to reference
         #if 'characters' in self.scene_data:
             #self.LoadCharacters()
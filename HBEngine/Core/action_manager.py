@@ -12,26 +12,101 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
+import difflib
+import heapq
 import inspect
 from HBEngine.Core.settings import Settings
+from HBEngine.Core.input_router import InputRouter
 from HBEngine.Core import transitions, actions
+from HBEngine.Core.BaseClasses.action import Action, FrozenData, ResolvedActionData
+from HBEngine.Core.BaseClasses.transition import Transition
+
+
+def BuildRegistry(module, base_class) -> dict:
+    """ Returns a dict of every subclass of 'base_class' defined in the provided module, keyed by class name """
+    return {
+        name: class_obj for name, class_obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(class_obj, base_class) and class_obj.__module__ == module.__name__
+    }
+
+
+# The action and transition classes available to data files, keyed by the name used to reference them. The built-in
+# actions and transitions are registered once on import
+action_registry = BuildRegistry(actions, Action)
+transition_registry = BuildRegistry(transitions, Transition)
+
+
+def RegisterAction(action_class):
+    """ A class decorator that makes a custom action available to data files using its class name """
+    action_registry[action_class.__name__] = action_class
+    return action_class
+
+
+def RegisterTransition(transition_class):
+    """ A class decorator that makes a custom transition available to data files using its class name """
+    transition_registry[transition_class.__name__] = transition_class
+    return transition_class
+
+
+def GetRegistered(registry, name, registry_type):
+    """ Returns the class registered under the provided name. Raises a ValueError listing similar names if not found """
+    if name in registry:
+        return registry[name]
+
+    suggestions = difflib.get_close_matches(str(name), registry.keys(), n=3)
+    if suggestions:
+        raise ValueError(f"The provided {registry_type} name '{name}' is invalid. Did you mean: "
+                         f"{', '.join(suggestions)}?")
+    raise ValueError(f"The provided {registry_type} name '{name}' is invalid. Please review the available "
+                     f"{registry_type}s, or add a new {registry_type} for the one provided")
 
 
 class ActionManager:
+    """
+    Runs the actions of a scene. Active actions are updated each frame until they complete, unless they're asleep.
+    Sleeping actions aren't updated at all, and are only woken once their deadline passes, or once an event they're
+    waiting for arrives (See 'Sleep' and 'SleepUntilEvent'). This allows actions that are only waiting (On a timer,
+    or for a sound to end) to cost nothing in the meantime
+
+    Deadlines use the scene's engine time, which advances by the scene's delta time each update. Headless runs use a
+    fixed timestep, so deadlines remain reproducible
+    """
     def __init__(self, scene):
 
         self.scene = scene
         self.active_actions = {}
 
+        # The active actions that are updated each frame. Sleeping actions are removed until they're woken
+        self.awake_actions = {}
+
+        # Pending wakeups are stored in a heap of (deadline, wakeup index, action) entries. Each sleeping action maps
+        # to the index of its latest wakeup, so wakeups that were cancelled (Or replaced) are skipped when popped
+        self.time = 0
+        self.wakeups = []
+        self.wakeup_count = 0
+        self.wakeup_indices = {}
+
+        # Actions waiting for an event are keyed by the event type. The manager subscribes to each type once
+        self.event_waiters = {}
+        self.subscribed_events = set()
+
     def Update(self, events):
+        self.time += self.scene.delta_time
+
+        # Wake any actions whose deadline has passed, in the order they're due
+        while self.wakeups and self.wakeups[0][0] <= self.time:
+            deadline, wakeup_index, action = heapq.heappop(self.wakeups)
+            if self.wakeup_indices.get(action) == wakeup_index:
+                self.WakeAction(action)
+
         pending_completion = []
-        if self.active_actions:
+        if self.awake_actions:
             # We can't edit the dict size while iterating, so if any actions are complete, store them and delete them
-            # afterwards
-            for action, null_val in self.active_actions.items():
+            # afterwards. Actions may also go to sleep while updating, so iterate over a copy
+            for action in list(self.awake_actions):
                 if action.complete is True:
                     pending_completion.append(action)
-                else:
+                elif action in self.awake_actions:
                     action.Update(events)
             if pending_completion:
                 for action in pending_completion:
@@ -42,62 +117,129 @@ class ActionManager:
                     if action.complete_delegate:
                         action.complete_delegate()
                     del self.active_actions[action]
+                    self.awake_actions.pop(action, None)
+
+    def Sleep(self, action, seconds=None):
+        """
+        Stop updating the provided action. If a number of seconds is provided, the action is woken once they've
+        passed. Otherwise, it sleeps until it's woken by an event, or until it completes
+        """
+        self.CancelWakeups(action)
+        self.awake_actions.pop(action, None)
+
+        if seconds is not None:
+            heapq.heappush(self.wakeups, (self.time + seconds, self.wakeup_count, action))
+            self.wakeup_indices[action] = self.wakeup_count
+            self.wakeup_count += 1
+
+    def SleepUntilEvent(self, action, event_type):
+        """ Stop updating the provided action until an event of the provided type arrives """
+        self.Sleep(action)
+        self.event_waiters.setdefault(event_type, []).append(action)
+
+        # Event subscriptions belong to the scene, so they're removed along with the rest of its input
+        if event_type not in self.subscribed_events:
+            self.subscribed_events.add(event_type)
+            InputRouter.getInstance().Subscribe(event_type, self.OnWaitedEvent, owner=self.scene)
+
+    def OnWaitedEvent(self, event):
+        """ Wake every action waiting for the type of the provided event """
+        for action in self.event_waiters.pop(event.type, []):
+            self.WakeAction(action, event)
+
+    def WakeAction(self, action, event=None):
+        """
+        Resume updating the provided action, and let it know why it was woken. 'event' is the event that woke the
+        action, or None if it was woken by its deadline
+        """
+        self.Resume(action)
+        if not action.complete:
+            action.Wake(event)
+
+    def Resume(self, action):
+        """ Resume updating the provided action, cancelling any pending wakeups. Does nothing for completed actions """
+        if action not in self.active_actions:
+            return
+
+        self.CancelWakeups(action)
+        self.awake_actions[action] = None
+
+    def CancelWakeups(self, action):
+        """ Remove the provided action from its pending deadline and any events it's waiting for """
+        self.wakeup_indices.pop(action, None)
+        for event_type, waiters in self.event_waiters.items():
+            if action in waiters:
+                waiters.remove(action)
+
+    def HasAwakeActions(self) -> bool:
+        """ Returns whether any actions need to be updated each frame """
+        return bool(self.awake_actions)
+
+    def GetTimeUntilWakeup(self):
+        """ Returns the seconds until the next sleeping action is due, or None if none are waiting on a deadline """
+        while self.wakeups and self.wakeup_indices.get(self.wakeups[0][2]) != self.wakeups[0][1]:
+            heapq.heappop(self.wakeups)
+
+        if self.wakeups:
+            return max(self.wakeups[0][0] - self.time, 0)
+        return None
+
+    def AdvanceTime(self, seconds):
+        """
+        Advance the engine time by time that wasn't included in the scene's delta time (Such as time spent idling), so
+        sleeping actions still wake on time
+        """
+        self.time += seconds
 
     def PerformAction(self, action_data, action_name, complete_delegate = None):
         """
         Given an action_data YAML block and an action name, create and run the associated action
         """
 
-        # Fetch the action function corresponding to the next action index
+        # Fetch the action function corresponding to the next action index. Action data is usually resolved when the
+        # scene is loaded, but data created at runtime is resolved here
         action = self.GetAction(action_name)
-        new_action = action(self.scene, action_data, self)
+        new_action = action(self.scene, self.ResolveActionData(action_data, action_name), self)
 
         # If the calling function wishes to be informed when the action is completed, opt in here
         if complete_delegate:
             new_action.complete_delegate = complete_delegate
 
         self.active_actions[new_action] = None
+        self.awake_actions[new_action] = None
 
         # Actions can opt in to return data. Return whatever is returned from the underlying action
         return new_action.Start()
 
-    def GetAction(self, action_name):
+    def ResolveActionData(self, action_data, action_name) -> ResolvedActionData:
         """
-        Returns the object associated with the provided action text
+        Return a read-only copy of the provided action data with the action's defaults and overrides applied. Data
+        that has already been resolved is returned as-is
         """
-        # Get a list of the action objects in the form of a list of tuples (object_name, object),
-        # and use the given action text as a lookup for an action in the list. If found, return it, otherwise
-        # return None
-        available_actions = inspect.getmembers(actions, inspect.isclass)
+        if isinstance(action_data, ResolvedActionData):
+            return action_data
 
-        for action, object_ref in available_actions:
-            if action_name == action:
-                return object_ref
+        resolved_data = self.GetAction(action_name).ResolveParams(action_data)
 
-        print("The provided action name is invalid. Please review the available actions, or add a new action function "
-              "for the one provided")
-        return None
+        # Interactables provide the action they perform when clicked as a child 'action' block. Resolve it as well
+        child_data = resolved_data.get("action")
+        if isinstance(child_data, dict) and "action" in child_data:
+            resolved_data["action"] = self.ResolveActionData(child_data, child_data["action"])
+
+        return ResolvedActionData(FrozenData.Freeze(resolved_data))
+
+    def GetAction(self, action_name):
+        """
+        Returns the object associated with the provided action text
+        """
+        return GetRegistered(action_registry, action_name, "action")
 
     def GetTransition(self, transition_data):
         """
         Returns the object associated with the provided transition text
         """
         if 'type' in transition_data:
-            transition = None
-
-            available_transitions = inspect.getmembers(transitions, inspect.isclass)
-            for transition, t_object in available_transitions:
-                if transition_data['type'] == transition:
-                    transition = t_object
-                    break
-
-            # The given transition name was not found, thus not populating 'transition' properly
-            if transition is None:
-                raise ValueError("The provided transition name is invalid. Please review the available transitions, "
-                                 "or add a new action object for the one provided")
-                return None
-
-            return transition
+            return GetRegistered(transition_registry, transition_data['type'], "transition")
         else:
             raise ValueError("No transition type specified - Unable to process transition")
 
@@ -29,15 +29,19 @@ All actions take in two parameters:
 All actions can be designed to accept and use a variety of different parameters. To learn more, review some of the
 provided actions
 """
+import io
+import os
 import pygame.mixer
 from HBEngine.Core.settings import Settings
+from HBEngine.Core.asset_cache import AssetCache
 from HBEngine.Core.BaseClasses.renderable_sprite import SpriteRenderable
 from HBEngine.Core.BaseClasses.renderable_text import TextRenderable
+from HBEngine.Core.BaseClasses.renderable_color import ColorRenderable
 from HBEngine.Core.BaseClasses.interactable import Interactable
 from HBEngine.Core.BaseClasses.button import Button
 from HBEngine.Core.BaseClasses.choice import Choice
 from HBEngine.Core.BaseClasses.renderable_container import Container
-from HBEngine.Core.BaseClasses.action import Action
+from HBEngine.Core.BaseClasses.action import Action, ParameterBlock, ProjectSetting
 from HBEngine.Core.BaseClasses.action_sound import SoundAction
 
 
@@ -52,6 +56,10 @@ class remove_renderable(Action):
         - type: str
         - speed: int
     """
+    defaults = {
+        "transition": {"type": "None"}
+    }
+
     def Start(self):
         if "key" in self.action_data:
             renderable = self.scene.active_renderables.renderables[self.action_data['key']]
@@ -62,7 +70,7 @@ class remove_renderable(Action):
                 self.active_transition.Start()
             else:
                 self.scene.active_renderables.Remove(self.action_data["key"])
-                self.scene.Draw()
+                self.scene.RequestDraw()
                 self.Complete()
         else:
             raise ValueError("'remove_renderable' action Failed - Key not specified")
@@ -88,33 +96,30 @@ class remove_container(Action):
             - type: str
             - speed: int
     """
+    defaults = {
+        "transition": {"type": "None"}
+    }
+
     def Start(self):
         if "key" in self.action_data:
             container = self.scene.active_renderables.renderables[self.action_data["key"]]
 
-            # Collect a flattened list of all children in this container
-            children = container.GetAllChildren()
-
             if "None" not in self.action_data["transition"]["type"]:
-                # In order to apply the transition to each and every child of the container, we merge the surfaces
-                # and combine them into the container surface. That way, the rendering only manages a single
+                # In order to apply the transition to each and every child of the container, the children are merged
+                # into a single composite surface that replaces them. That way, the rendering only manages a single
                 # surface. This causes containers to be non-functional once a transition starts, as the underlying
                 # children are destroyed before the transition begins
-
-                # Merge the surfaces, then delete the child (Grim, I know)
-                for child in list(children):
-                    container.surface.blit(child.GetSurface(), (child.rect.x, child.rect.y))
+                for child in container.Flatten():
                     self.scene.active_renderables.Remove(child.key)
 
-                container.visible = True
                 self.active_transition = self.a_manager.CreateTransition(self.action_data["transition"], container)
                 self.active_transition.Start()
             else:
                 # Remove all children first
-                for child in children:
+                for child in container.GetAllChildren():
                     self.scene.active_renderables.Remove(child.key)
                 self.scene.active_renderables.Remove(self.action_data['key'])
-                self.scene.Draw()
+                self.scene.RequestDraw()
                 self.Complete()
         else:
             raise ValueError("'remove_renderable' action Failed - Key not specified")
@@ -141,29 +146,19 @@ class create_dialogue_interface(Action):
         - z_order: int <GLOBAL_AVAILABLE>
         - center_align: bool <GLOBAL_AVAILABLE>
     """
+    defaults = {
+        "sprite": ProjectSetting("Dialogue", "dialogue_frame_sprite"),
+        "position": ProjectSetting("Dialogue", "dialogue_frame_position"),
+        "z_order": ProjectSetting("Dialogue", "dialogue_frame_z_order"),
+        "center_align": ProjectSetting("Dialogue", "dialogue_frame_center_align")
+    }
+    overrides = {
+        "key": "DialogueFrame"
+    }
+
     def Start(self):
         self.skippable = False
 
-        # Action-specific adjustments
-        self.action_data["key"] = "DialogueFrame"
-
-        # PROJECT DEFAULTS OVERRIDE
-        if "sprite" not in self.action_data:
-            self.action_data['sprite'] = Settings.getInstance().project_settings['Dialogue'][
-                'dialogue_frame_sprite']
-
-        if "position" not in self.action_data:
-            self.action_data['position'] = Settings.getInstance().project_settings['Dialogue'][
-                'dialogue_frame_position']
-
-        if "z_order" not in self.action_data:
-            self.action_data['z_order'] = Settings.getInstance().project_settings['Dialogue'][
-                'dialogue_frame_z_order']
-
-        if "center_align" not in self.action_data:
-            self.action_data['center_align'] = Settings.getInstance().project_settings['Dialogue'][
-                'dialogue_frame_center_align']
-
         dialogue_frame = SpriteRenderable(
             self.scene,
             self.action_data
@@ -172,7 +167,7 @@ class create_dialogue_interface(Action):
         # Add the dialogue interface to the sprite group so they exist until explicitly unloaded
         self.scene.active_renderables.Add(dialogue_frame)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
 class create_background(Action):
@@ -185,18 +180,18 @@ class create_background(Action):
     - flip : bool
     - z_order : int <GLOBAL_AVAILABLE>
     """
+    defaults = {
+        "z_order": ProjectSetting("Sprite", "background_z_order")
+    }
+    overrides = {
+        "position": (0, 0),
+        "key": "Background",
+        "center_align": False
+    }
+
     def Start(self):
         self.skippable = False
 
-        # Background-specific adjustments
-        self.action_data["position"] = (0,0)
-        self.action_data["key"] = "Background"
-        self.action_data["center_align"] = False
-
-        # PROJECT DEFAULTS OVERRIDE
-        if "z_order" not in self.action_data:
-            self.action_data["z_order"] = Settings.getInstance().project_settings["Sprite"]["background_z_order"]
-
         new_sprite = SpriteRenderable(
             self.scene,
             self.action_data,
@@ -204,7 +199,7 @@ class create_background(Action):
 
         self.scene.active_renderables.Add(new_sprite)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
         return new_sprite
@@ -224,21 +219,14 @@ class create_sprite(Action):
         - type: str
         - speed: int
     """
-    def Start(self):
-
-        # OVERRIDES WITH NO PROJECT DEFAULTS
-        if "position" not in self.action_data:
-            self.action_data["position"] = (0, 0)
-
-        # PROJECT DEFAULTS OVERRIDE
-        if "z_order" not in self.action_data:
-            self.action_data["z_order"] = Settings.getInstance().project_settings["Sprite"][
-                "z_order"]
-
-        if "center_align" not in self.action_data:
-            self.action_data["center_align"] = Settings.getInstance().project_settings["Sprite"][
-                "center_align"]
+    defaults = {
+        "position": (0, 0),
+        "z_order": ProjectSetting("Sprite", "z_order"),
+        "center_align": ProjectSetting("Sprite", "center_align"),
+        "transition": {"type": "None"}
+    }
 
+    def Start(self):
         new_sprite = SpriteRenderable(
             self.scene,
             self.action_data
@@ -256,7 +244,7 @@ class create_sprite(Action):
             self.active_transition = self.a_manager.CreateTransition(self.action_data["transition"], new_sprite)
             self.active_transition.Start()
         else:
-            self.scene.Draw()
+            self.scene.RequestDraw()
             self.Complete()
 
         return new_sprite
@@ -274,22 +262,15 @@ class create_sprite(Action):
 
 class create_interactable(Action):  # AWAITING EDITOR IMPLEMENTATION - WILL BE UPDATED
     """ Creates an interactable renderable, and adds it to the renderable stack. Returns an 'Interactable'"""
+    defaults = {
+        "position": (0, 0),
+        "z_order": ProjectSetting("Interactable", "z_order"),
+        "center_align": ProjectSetting("Interactable", "center_align")
+    }
+
     def Start(self):
         self.skippable = False
 
-        # OVERRIDES WITH NO PROJECT DEFAULTS
-        if 'position' not in self.action_data:
-            self.action_data['position'] = (0, 0)
-
-        # PROJECT DEFAULTS OVERRIDE
-        if 'z_order' not in self.action_data:
-            self.action_data['z_order'] = Settings.getInstance().project_settings['Interactable'][
-                'z_order']
-
-        if 'center_align' not in self.action_data:
-            self.action_data['center_align'] = Settings.getInstance().project_settings['Interactable'][
-                'center_align']
-
         new_renderable = Interactable(
             self.scene,
             self.action_data,
@@ -302,7 +283,7 @@ class create_interactable(Action):  # AWAITING EDITOR IMPLEMENTATION - WILL BE U
 
         self.scene.active_renderables.Add(new_renderable)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
         return new_renderable
@@ -325,32 +306,18 @@ class create_text(Action):
         - type: str
         - speed: int
     """
+    defaults = {
+        "position": (0, 0),
+        "z_order": ProjectSetting("Text", "z_order"),
+        "center_align": ProjectSetting("Text", "center_align"),
+        "wrap_bounds": ProjectSetting("Text", "wrap_bounds"),
+        "font": ProjectSetting("Text", "font"),
+        "text_size": ProjectSetting("Text", "size"),
+        "text_color": ProjectSetting("Text", "color"),
+        "transition": {"type": "None"}
+    }
 
     def Start(self):
-
-        # OVERRIDES WITH NO PROJECT DEFAULTS
-        if "position" not in self.action_data:
-            self.action_data["position"] = (0,0)
-
-        # PROJECT DEFAULTS OVERRIDE
-        if "z_order" not in self.action_data:
-            self.action_data["z_order"] = Settings.getInstance().project_settings["Text"]['z_order']
-
-        if "center_align" not in self.action_data:
-            self.action_data["center_align"] = Settings.getInstance().project_settings["Text"]["center_align"]
-
-        if "wrap_bounds" not in self.action_data:
-            self.action_data["wrap_bounds"] = Settings.getInstance().project_settings["Text"]["wrap_bounds"]
-
-        if "font" not in self.action_data:
-            self.action_data["font"] = Settings.getInstance().project_settings["Text"]["font"]
-
-        if "text_size" not in self.action_data:
-            self.action_data["text_size"] = Settings.getInstance().project_settings["Text"]["size"]
-
-        if "text_color" not in self.action_data:
-            self.action_data["text_color"] = Settings.getInstance().project_settings["Text"]["color"]
-
         new_text_renderable = TextRenderable(
             self.scene,
             self.action_data
@@ -364,7 +331,7 @@ class create_text(Action):
             self.active_transition = self.a_manager.CreateTransition(self.action_data["transition"], new_text_renderable)
             self.active_transition.Start()
         else:
-            self.scene.Draw()
+            self.scene.RequestDraw()
             self.Complete()
 
         return new_text_renderable
@@ -382,47 +349,33 @@ class create_text(Action):
 
 class create_button(Action):  # AWAITING EDITOR IMPLEMENTATION - WILL BE UPDATED
     """ Creates a button interactable, and adds it to the renderable stack. Returns a 'Button' """
+    defaults = {
+        "position": (0, 0),
+        "sprite": ProjectSetting("Button", "sprite"),
+        "sprite_hover": ProjectSetting("Button", "sprite_hover"),
+        "sprite_clicked": ProjectSetting("Button", "sprite_clicked"),
+        "z_order": ProjectSetting("Button", "button_z_order"),
+        "center_align": ProjectSetting("Button", "button_center_align"),
+        "text_z_order": ProjectSetting("Button", "text_z_order"),
+        "text_center_align": ProjectSetting("Button", "text_center_align"),
+        "font": ProjectSetting("Button", "font"),
+        "text_size": ProjectSetting("Button", "text_size"),
+        "text_color": ProjectSetting("Button", "text_color")
+    }
+
+    @classmethod
+    def ResolveParams(cls, action_data) -> dict:
+        resolved_data = super().ResolveParams(action_data)
+
+        # The text is positioned with the button unless specified otherwise
+        if "text_position" not in resolved_data:
+            resolved_data["text_position"] = resolved_data["position"]
+
+        return resolved_data
+
     def Start(self):
         self.skippable = False
 
-        # OVERRIDES WITH NO PROJECT DEFAULTS
-        if 'position' not in self.action_data:
-            self.action_data['position'] = (0, 0)
-
-        if 'text_position' not in self.action_data:
-            self.action_data['text_position'] = self.action_data['position']
-
-        # PROJECT DEFAULTS OVERRIDE
-        if 'sprite' not in self.action_data:
-            self.action_data['sprite'] = Settings.getInstance().project_settings['Button']['sprite']
-
-        if 'sprite_hover' not in self.action_data:
-            self.action_data['sprite_hover'] = Settings.getInstance().project_settings['Button']['sprite_hover']
-
-        if 'sprite_clicked' not in self.action_data:
-            self.action_data['sprite_clicked'] = Settings.getInstance().project_settings['Button']['sprite_clicked']
-
-        if 'z_order' not in self.action_data:
-            self.action_data['z_order'] = Settings.getInstance().project_settings['Button']['button_z_order']
-
-        if 'center_align' not in self.action_data:
-            self.action_data['center_align'] = Settings.getInstance().project_settings['Button']['button_center_align']
-
-        if 'text_z_order' not in self.action_data:
-            self.action_data['text_z_order'] = Settings.getInstance().project_settings['Button']['text_z_order']
-
-        if 'text_center_align' not in self.action_data:
-            self.action_data['center_align'] = Settings.getInstance().project_settings['Button']['text_center_align']
-
-        if 'font' not in self.action_data:
-            self.action_data['font'] = Settings.getInstance().project_settings['Button']['font']
-
-        if 'text_size' not in self.action_data:
-            self.action_data['text_size'] = Settings.getInstance().project_settings['Button']['text_size']
-
-        if 'text_color' not in self.action_data:
-            self.action_data['text_color'] = Settings.getInstance().project_settings['Button']['text_color']
-
         new_renderable = Button(
             self.scene,
             self.action_data
@@ -435,23 +388,29 @@ class create_button(Action):  # AWAITING EDITOR IMPLEMENTATION - WILL BE UPDATED
 
         self.scene.active_renderables.Add(new_renderable)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
         return new_renderable
 
 class create_container(Action): # AWAITING EDITOR IMPLEMENTATION - WILL BE UPDATED
-    """ Creates a simple container renderable with the provided action data. Returns a 'Container' """
+    """
+    Creates a simple container renderable with the provided action data. Returns a 'Container'
+    Possible Parameters:
+    - cache_composite : bool (Draw the children as a single cached surface. See 'Container')
+    """
+
+    # Containers aren't rendered, so use fixed values
+    overrides = {
+        "position": (0, 0),
+        "z_order": 0,
+        "center_align": False
+    }
 
     # @TODO: Update to new workflow
     def Start(self):
         self.skippable = False
 
-        # Container-specific adjustments
-        self.action_data['position'] = (0, 0)
-        self.action_data['z_order'] = 0
-        self.action_data['center_align'] = False
-
         # Containers aren't rendered, so use defaults
         new_renderable = Container(
             self.scene,
@@ -460,7 +419,7 @@ class create_container(Action): # AWAITING EDITOR IMPLEMENTATION - WILL BE UPDAT
 
         self.scene.active_renderables.Add(new_renderable)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
         return new_renderable
@@ -486,40 +445,41 @@ class dialogue(Action):
         - speed: int
     """
 
+    defaults = {
+        "speaker": ParameterBlock(
+            defaults={
+                "position": ProjectSetting("Dialogue", "speaker_text_position"),
+                "center_align": ProjectSetting("Dialogue", "speaker_center_align"),
+                "text_size": ProjectSetting("Dialogue", "speaker_text_size"),
+                "text_color": ProjectSetting("Dialogue", "speaker_text_color"),
+                "font": ProjectSetting("Dialogue", "speaker_font"),
+                "z_order": ProjectSetting("Dialogue", "speaker_z_order")
+            },
+            overrides={
+                "key": "SpeakerText",
+                "wrap_bounds": ProjectSetting("Dialogue", "speaker_wrap_bounds")
+            }
+        ),
+        "dialogue": ParameterBlock(
+            defaults={
+                "position": ProjectSetting("Dialogue", "dialogue_text_position"),
+                "center_align": ProjectSetting("Dialogue", "dialogue_center_align"),
+                "text_size": ProjectSetting("Dialogue", "dialogue_text_size"),
+                "text_color": ProjectSetting("Dialogue", "dialogue_text_color"),
+                "font": ProjectSetting("Dialogue", "dialogue_font"),
+                "z_order": ProjectSetting("Dialogue", "dialogue_z_order"),
+                "transition": {"type": "fade_in", "speed": 1000}
+            },
+            overrides={
+                "key": "DialogueText",
+                "wrap_bounds": ProjectSetting("Dialogue", "dialogue_wrap_bounds")
+            }
+        )
+    }
+
     def Start(self):
-        # If the user has specified a 'speaker' block, build the speaker renderable details using any provided
-        # information, and / or any global settings
+        # If the user has specified a 'speaker' block, build the speaker renderable
         if "speaker" in self.action_data:
-            # Dialogue-specific adjustments
-            self.action_data["speaker"]['key'] = "SpeakerText"
-            self.action_data["speaker"]["wrap_bounds"] = Settings.getInstance().project_settings["Dialogue"][
-                    "speaker_wrap_bounds"]
-
-            # PROJECT DEFAULTS OVERRIDE
-            if "position" not in self.action_data["speaker"]:
-                self.action_data["speaker"]["position"] = Settings.getInstance().project_settings["Dialogue"][
-                    "speaker_text_position"]
-
-            if "center_align" not in self.action_data["speaker"]:
-                self.action_data["speaker"]["center_align"] = Settings.getInstance().project_settings["Dialogue"][
-                    "speaker_center_align"]
-
-            if "text_size" not in self.action_data["speaker"]:
-                self.action_data["speaker"]["text_size"] = Settings.getInstance().project_settings["Dialogue"][
-                    "speaker_text_size"]
-
-            if "text_color" not in self.action_data["speaker"]:
-                self.action_data["speaker"]["text_color"] = Settings.getInstance().project_settings["Dialogue"][
-                    "speaker_text_color"]
-
-            if "font" not in self.action_data["speaker"]:
-                self.action_data["speaker"]["font"] = Settings.getInstance().project_settings["Dialogue"][
-                    "speaker_font"]
-
-            if "z_order" not in self.action_data["speaker"]:
-                self.action_data["speaker"]["z_order"] = Settings.getInstance().project_settings["Dialogue"][
-                    "speaker_z_order"]
-
             new_speaker_text = TextRenderable(
                 self.scene,
                 self.action_data["speaker"]
@@ -527,38 +487,8 @@ class dialogue(Action):
             # Speaker text does not support transitions currently
             self.scene.active_renderables.Add(new_speaker_text)
 
-        # If the user has specified a 'dialogue' block, build the speaker renderable
+        # If the user has specified a 'dialogue' block, build the dialogue renderable
         if "dialogue" in self.action_data:
-            # Dialogue-specific adjustments
-            self.action_data["dialogue"]["key"] = "DialogueText"
-            self.action_data["dialogue"]["wrap_bounds"] = Settings.getInstance().project_settings["Dialogue"][
-                "dialogue_wrap_bounds"]
-
-            # PROJECT DEFAULTS OVERRIDE
-            if "position" not in self.action_data["dialogue"]:
-                self.action_data["dialogue"]["position"] = Settings.getInstance().project_settings["Dialogue"][
-                    "dialogue_text_position"]
-
-            if "center_align" not in self.action_data["dialogue"]:
-                self.action_data["dialogue"]["center_align"] = Settings.getInstance().project_settings["Dialogue"][
-                    "dialogue_center_align"]
-
-            if "text_size" not in self.action_data["dialogue"]:
-                self.action_data["dialogue"]["text_size"] = Settings.getInstance().project_settings["Dialogue"][
-                    "dialogue_text_size"]
-
-            if "text_color" not in self.action_data["dialogue"]:
-                self.action_data["dialogue"]["text_color"] = Settings.getInstance().project_settings["Dialogue"][
-                    "dialogue_text_color"]
-
-            if "font" not in self.action_data["dialogue"]:
-                self.action_data["dialogue"]["font"] = Settings.getInstance().project_settings["Dialogue"][
-                    "dialogue_font"]
-
-            if "z_order" not in self.action_data["dialogue"]:
-                self.action_data["dialogue"]["z_order"] = Settings.getInstance().project_settings["Dialogue"][
-                    "dialogue_z_order"]
-
             new_dialogue_text = TextRenderable(
                 self.scene,
                 self.action_data["dialogue"]
@@ -567,18 +497,14 @@ class dialogue(Action):
             self.scene.active_renderables.Add(new_dialogue_text)
 
             # By default, dialogue text fades in. However, allow the user to override this behaviour
-            if "None" not in self.action_data["dialogue"]["transition"]["type"]:
-                self.active_transition = self.a_manager.CreateTransition(self.action_data["dialogue"]["transition"],
-                                                                         new_dialogue_text)
-                self.active_transition.Start()
-            else:
-                self.action_data["dialogue"]["transition"] = {
+            transition_data = self.action_data["dialogue"]["transition"]
+            if "None" in transition_data["type"]:
+                transition_data = {
                     "type": "fade_in",
                     "speed": 1000
                 }
-                self.active_transition = self.a_manager.CreateTransition(self.action_data["dialogue"]["transition"],
-                                                                         new_dialogue_text)
-                self.active_transition.Start()
+            self.active_transition = self.a_manager.CreateTransition(transition_data, new_dialogue_text)
+            self.active_transition.Start()
 
         return None
 
@@ -600,6 +526,36 @@ class character_dialogue(Action):
     Returns None
     """
 
+    defaults = {
+        "speaker": ParameterBlock(
+            defaults={
+                "position": ProjectSetting("Dialogue", "speaker_text_position"),
+                "z_order": ProjectSetting("Dialogue", "speaker_z_order"),
+                "center_align": ProjectSetting("Dialogue", "speaker_center_align"),
+                "font": ProjectSetting("Dialogue", "speaker_font"),
+                "text_size": ProjectSetting("Dialogue", "speaker_text_size"),
+                "text_color": ProjectSetting("Dialogue", "speaker_text_color")
+            },
+            overrides={
+                "key": "SpeakerText"
+            }
+        ),
+        "dialogue": ParameterBlock(
+            defaults={
+                "position": ProjectSetting("Dialogue", "dialogue_text_position"),
+                "z_order": ProjectSetting("Dialogue", "dialogue_z_order"),
+                "center_align": ProjectSetting("Dialogue", "dialogue_center_align"),
+                "font": ProjectSetting("Dialogue", "dialogue_font"),
+                "text_size": ProjectSetting("Dialogue", "dialogue_text_size"),
+                "text_color": ProjectSetting("Dialogue", "dialogue_text_color"),
+                "transition": {"type": "fade_in", "speed": 1000}
+            },
+            overrides={
+                "key": "DialogueText"
+            }
+        )
+    }
+
     def Start(self):
 
         # Dialogue-specific adjustments
@@ -607,11 +563,10 @@ class character_dialogue(Action):
             "The active scene is not of the 'DialogueScene' type. This action can not be performed"
         )
 
-        #@TODO: Can we consolidate to avoid duplicated if checks for global settings?
         # If the user provides a 'character' block, use details from the relevant character data file if it exists, as
-        # well as any applicable global settings
+        # well as any applicable global settings. The character data is copied, as it's shared by every line they speak
         if 'character' in self.action_data:
-            character_data = self.scene.character_data[self.action_data['character']]
+            character_data = dict(self.scene.character_data[self.action_data['character']])
 
             # Dialogue-specific adjustments
             character_data['key'] = 'SpeakerText'
@@ -648,37 +603,8 @@ class character_dialogue(Action):
             # Speaker text does not support transitions currently
             self.scene.active_renderables.Add(new_character_text)
 
-        # If the user has specified a 'speaker' block, build the speaker renderable details using any provided
-        # information, and / or any global settings
+        # If the user has specified a 'speaker' block, build the speaker renderable
         elif 'speaker' in self.action_data:
-            # Dialogue-specific adjustments
-            self.action_data['speaker']['key'] = 'SpeakerText'
-
-            # PROJECT DEFAULTS OVERRIDE
-            if 'position' not in self.action_data['speaker']:
-                self.action_data['speaker']['position'] = Settings.getInstance().project_settings['Dialogue'][
-                    'speaker_text_position']
-
-            if 'z_order' not in self.action_data['speaker']:
-                self.action_data['speaker']['z_order'] = Settings.getInstance().project_settings['Dialogue'][
-                    'speaker_z_order']
-
-            if 'center_align' not in self.action_data['speaker']:
-                self.action_data['speaker']['center_align'] = Settings.getInstance().project_settings['Dialogue'][
-                    'speaker_center_align']
-
-            if 'font' not in self.action_data['speaker']:
-                self.action_data['speaker']['font'] = Settings.getInstance().project_settings['Dialogue'][
-                    'speaker_font']
-
-            if 'text_size' not in self.action_data['speaker']:
-                self.action_data['speaker']['text_size'] = Settings.getInstance().project_settings['Dialogue'][
-                    'speaker_text_size']
-
-            if 'text_color' not in self.action_data['speaker']:
-                self.action_data['speaker']['text_color'] = Settings.getInstance().project_settings['Dialogue'][
-                    'speaker_text_color']
-
             new_speaker_text = TextRenderable(
                 self.scene,
                 self.action_data['speaker']
@@ -686,36 +612,8 @@ class character_dialogue(Action):
             # Speaker text does not support transitions currently
             self.scene.active_renderables.Add(new_speaker_text)
 
-        # If the user has specified a 'dialogue' block, build the speaker renderable
+        # If the user has specified a 'dialogue' block, build the dialogue renderable
         if 'dialogue' in self.action_data:
-            # Dialogue-specific adjustments
-            self.action_data['dialogue']['key'] = 'DialogueText'
-
-            # PROJECT DEFAULTS OVERRIDE
-            if 'position' not in self.action_data['dialogue']:
-                self.action_data['dialogue']['position'] = Settings.getInstance().project_settings['Dialogue'][
-                    'dialogue_text_position']
-
-            if 'z_order' not in self.action_data['dialogue']:
-                self.action_data['dialogue']['z_order'] = Settings.getInstance().project_settings['Dialogue'][
-                    'dialogue_z_order']
-
-            if 'center_align' not in self.action_data['dialogue']:
-                self.action_data['dialogue']['center_align'] = Settings.getInstance().project_settings['Dialogue'][
-                    'dialogue_center_align']
-
-            if 'font' not in self.action_data['dialogue']:
-                self.action_data['dialogue']['font'] = Settings.getInstance().project_settings['Dialogue'][
-                    'dialogue_font']
-
-            if 'text_size' not in self.action_data['dialogue']:
-                self.action_data['dialogue']['text_size'] = Settings.getInstance().project_settings['Dialogue'][
-                    'dialogue_text_size']
-
-            if 'text_color' not in self.action_data['dialogue']:
-                self.action_data['dialogue']['text_color'] = Settings.getInstance().project_settings['Dialogue'][
-                    'dialogue_text_color']
-
             new_dialogue_text = TextRenderable(
                 self.scene,
                 self.action_data['dialogue']
@@ -724,18 +622,9 @@ class character_dialogue(Action):
             self.scene.active_renderables.Add(new_dialogue_text)
 
             # By default, dialogue text fades in. However, allow the user to override this behaviour
-            if 'transition' in self.action_data['dialogue']:
-                self.active_transition = self.a_manager.CreateTransition(self.action_data['dialogue']['transition'],
-                                                                         new_dialogue_text)
-                self.active_transition.Start()
-            else:
-                self.action_data['dialogue']['transition'] = {
-                    'type': 'fade_in',
-                    'speed': 1000
-                }
-                self.active_transition = self.a_manager.CreateTransition(self.action_data['dialogue']['transition'],
-                                                                         new_dialogue_text)
-                self.active_transition.Start()
+            self.active_transition = self.a_manager.CreateTransition(self.action_data['dialogue']['transition'],
+                                                                     new_dialogue_text)
+            self.active_transition.Start()
 
         return None
 
@@ -758,6 +647,12 @@ class create_character(Action):
     Returns a 'SpriteRenderable'.
     This action is only available in DialogueScenes, and requires a 'character' block be provided
     """
+    defaults = {
+        "position": (0, 0),
+        "z_order": ProjectSetting("Sprite", "z_order"),
+        "center_align": ProjectSetting("Sprite", "center_align")
+    }
+
     def Start(self):
 
         # Character-specific adjustments
@@ -775,24 +670,12 @@ class create_character(Action):
 
         assert 'moods' in character_data, print(
             f"Character file '{self.action_data['character']['name']}' does not have a 'moods' block")
-        self.action_data['sprite'] = character_data['moods'][self.action_data['character']['mood']]
-
-        # OVERRIDES WITH NO PROJECT DEFAULTS
-        if 'position' not in self.action_data:
-            self.action_data['position'] = (0, 0)
-
-        # PROJECT DEFAULTS OVERRIDE
-        if 'z_order' not in self.action_data:
-            self.action_data['z_order'] = Settings.getInstance().project_settings['Sprite'][
-                'z_order']
-
-        if 'center_align' not in self.action_data:
-            self.action_data['center_align'] = Settings.getInstance().project_settings['Sprite'][
-                'center_align']
+        sprite_data = dict(self.action_data)
+        sprite_data['sprite'] = character_data['moods'][self.action_data['character']['mood']]
 
         new_sprite = SpriteRenderable(
             self.scene,
-            self.action_data
+            sprite_data
         )
 
         # If the user requested a flip action, do so
@@ -807,7 +690,7 @@ class create_character(Action):
             self.active_transition = self.a_manager.CreateTransition(self.action_data['transition'], new_sprite)
             self.active_transition.Start()
         else:
-            self.scene.Draw()
+            self.scene.RequestDraw()
             self.Complete()
 
         return new_sprite
@@ -826,69 +709,53 @@ class create_character(Action):
 
 #@TODO: Organize dialogue actions into their own sections (dialogue, choice, choose_branch)
 class choice(Action):
-    def Start(self):
-        self.skippable = False
-
-        # Choice-specific adjustments
-        self.action_data["position"] = (0, 0)
-        self.action_data["z_order"] = 0
-        self.action_data["center_align"] = False
-        self.action_data["key"] = "Choice"
-
-        # All choice options use the same underlying 'create_button' action. Specify and enforce that here
-        # Additionally, apply all settings determined here to each choice button
-        for choice in self.action_data["choices"]:
-            # Build the child dict that gets sent to the interact action
-            choice["action"] = {
+    """
+    Creates a choice container with a button for each of the provided choices. Returns a 'Choice'
+    Possible Parameters:
+    - choices : list
+    - cache_composite : bool (Draw the buttons as a single cached surface. See 'Container')
+    """
+    # All choice options use the same underlying button, which is given these settings
+    defaults = {
+        "choices": ParameterBlock(
+            defaults={
+                "text_position": (0, 0),
+                "sprite": ProjectSetting("Choice", "button_sprite"),
+                "sprite_hover": ProjectSetting("Choice", "button_sprite_hover"),
+                "sprite_clicked": ProjectSetting("Choice", "button_sprite_clicked"),
+                "z_order": ProjectSetting("Choice", "button_z_order"),
+                "center_align": ProjectSetting("Choice", "button_center_align"),
+                "text_z_order": ProjectSetting("Choice", "button_text_z_order"),
+                "text_center_align": ProjectSetting("Choice", "button_text_center_align"),
+                "font": ProjectSetting("Choice", "button_font"),
+                "text_size": ProjectSetting("Choice", "button_text_size"),
+                "text_color": ProjectSetting("Choice", "button_text_color")
+            }
+        )
+    }
+    overrides = {
+        "position": (0, 0),
+        "z_order": 0,
+        "center_align": False,
+        "key": "Choice"
+    }
+
+    @classmethod
+    def ResolveParams(cls, action_data) -> dict:
+        resolved_data = super().ResolveParams(action_data)
+
+        # Each choice button switches to its branch when clicked
+        for choice_data in resolved_data["choices"]:
+            choice_data["action"] = {
                 "action": "choose_branch",
-                "branch": choice["branch"],
-                "key": choice["key"]
+                "branch": choice_data["branch"],
+                "key": choice_data["key"]
             }
 
-            # CHOICE BUTTONS - OVERRIDES WITH NO PROJECT DEFAULTS
-            if "text_position" not in choice:
-                choice["text_position"] = self.action_data["position"]
-
-            # CHOICE BUTTONS - PROJECT DEFAULTS OVERRIDE
-            if "sprite" not in choice:
-                choice["sprite"] = Settings.getInstance().project_settings["Choice"][
-                    "button_sprite"]
-
-            if 'sprite_hover' not in choice:
-                choice["sprite_hover"] = Settings.getInstance().project_settings["Choice"][
-                    "button_sprite_hover"]
+        return resolved_data
 
-            if "sprite_clicked" not in choice:
-                choice["sprite_clicked"] = Settings.getInstance().project_settings["Choice"][
-                    "button_sprite_clicked"]
-
-            if "z_order" not in choice:
-                choice["z_order"] = Settings.getInstance().project_settings["Choice"][
-                    "button_z_order"]
-
-            if "center_align" not in choice:
-                choice["center_align"] = Settings.getInstance().project_settings["Choice"][
-                    "button_center_align"]
-
-            if "text_z_order" not in choice:
-                choice["text_z_order"] = Settings.getInstance().project_settings["Choice"][
-                    "button_text_z_order"]
-
-            if "text_center_align" not in choice:
-                choice["center_align"] = Settings.getInstance().project_settings["Choice"][
-                    "button_text_center_align"]
-
-            if "font" not in choice:
-                choice["font"] = Settings.getInstance().project_settings["Choice"][
-                    "button_font"]
-
-            if "text_size" not in choice:
-                choice["text_size"] = Settings.getInstance().project_settings["Choice"][
-                    "button_text_size"]
-
-            if "text_color" not in choice:
-                choice["text_color"] = Settings.getInstance().project_settings["Choice"][
-                    "button_text_color"]
+    def Start(self):
+        self.skippable = False
 
         # Choices provide blocks of options. Each one needs to be built
         new_renderable = Choice(
@@ -898,11 +765,11 @@ class choice(Action):
 
         # Generate and add each choice button to the choice container
         for choice_data in self.action_data["choices"]:
-            new_renderable.children.append(self.a_manager.PerformAction(choice_data, "create_choice_button"))
+            new_renderable.AddChild(self.a_manager.PerformAction(choice_data, "create_choice_button"))
 
         self.scene.active_renderables.Add(new_renderable)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
         return new_renderable
@@ -926,7 +793,7 @@ class create_choice_button(Action):
 
         self.scene.active_renderables.Add(new_renderable)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
         return new_renderable
@@ -943,7 +810,7 @@ class choose_branch(Action):
 
         self.scene.SwitchDialogueBranch(self.action_data['branch'])
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
         self.Complete()
 
 # -------------- SOUND ACTIONS --------------
@@ -957,23 +824,46 @@ class play_sfx(SoundAction):
     """
 
     def Start(self):
-        new_sound = pygame.mixer.Sound(Settings.getInstance().ConvertPartialToAbsolutePath(self.action_data["sound"]))
-        new_sound.set_volume(self.action_data["volume"])
+        # Sound objects are shared through the asset cache, so the volume is applied to the channel playing it
+        self.sound = AssetCache.getInstance().GetSound(self.action_data["sound"])
+
+        # Sound objects don't have a way of checking their progress, so let's keep track of the channel it was
+        # assigned to. Each channel posts its own end event once its sound finishes. These are assigned before
+        # playing so even the shortest sounds post one
+        self.AssignChannelEndEvents()
+        self.assigned_channel = self.sound.play(0)
+        if self.assigned_channel is None:
+            print(f"Failed to play '{self.action_data['sound']}' - No sound channels are available")
+            self.Complete()
+            return None
 
-        # Sound objects don't have a way of checking their progress, so let's keep track and monitor
-        # the channel it was assigned to. Once it's empty, it's a good assumption that it's successfully completed
-        self.assigned_channel = new_sound.play(0)
-        self.scene.active_sounds[self.action_data["key"]] = new_sound
+        self.assigned_channel.set_volume(self.action_data["volume"])
+
+        # Store the channel rather than the shared sound, so stopping it doesn't stop other plays of the same sound
+        self.scene.active_sounds[self.action_data["key"]] = self.assigned_channel
+
+        # Sleep until the channel finishes instead of checking it every frame
+        self.SleepUntilFinished(self.assigned_channel.get_endevent(), self.sound.get_length())
 
         return self.assigned_channel
 
-    def Update(self, events):
-        if not self.assigned_channel.get_busy():
-            self.scene.active_sounds.pop(self.action_data["key"])
-            self.Complete()
+    def Wake(self, event):
+        if event is None:
+            # The sound's length has passed in simulated time. Stop it, as the device plays it in real time
+            if self.assigned_channel.get_sound() is self.sound:
+                self.assigned_channel.stop()
+            self.Skip()
+
+        # The end event may belong to an earlier sound on the same channel. If this sound is still playing, keep
+        # waiting for the next one
+        elif self.assigned_channel.get_busy() and self.assigned_channel.get_sound() is self.sound:
+            self.a_manager.SleepUntilEvent(self, event.type)
+        else:
+            self.Skip()
 
     def Skip(self):
-        self.scene.active_sounds.pop(self.action_data["key"])
+        if self.scene.active_sounds.get(self.action_data["key"]) is self.assigned_channel:
+            self.scene.active_sounds.pop(self.action_data["key"])
         self.Complete()
 
 class stop_sfx(Action):
@@ -995,24 +885,31 @@ class stop_sfx(Action):
             raise ValueError("'stop_sfx' action Failed - Key not specified")
 
 class play_music(SoundAction):
-    #@TODO: Implement end-event so this action completes when the song reaches last frame
     """
     Possible Parameters:
     - music: str
     - volume : float
     - loop : bool
     """
+    # Music lengths measured for headless runs, keyed by music path
+    music_lengths = {}
 
     def Start(self):
         self.skippable = False
 
         # If the user hasn't removed the previous music, forcefully remove it here without any transition
         if self.scene.active_music:
-            pygame.mixer.music.stop()  # This will invoke the end-event on the existing music action
+            pygame.mixer.music.stop()
+            self.scene.active_music.Complete()
 
         # The pygame music system doesn't use objects, but instead uses a stream. Any changes made against music
         # are made to the stream itself
-        pygame.mixer.music.load(Settings.getInstance().ConvertPartialToAbsolutePath(self.action_data["music"]))
+        # The music file is streamed from the (possibly prefetched) cached file data. The extension is provided as a
+        # hint for the file format
+        pygame.mixer.music.load(
+            io.BytesIO(AssetCache.getInstance().GetFileData(self.action_data["music"])),
+            os.path.splitext(self.action_data["music"])[1][1:]
+        )
         pygame.mixer.music.set_volume(self.action_data["volume"])
 
         loop_count = 0
@@ -1023,13 +920,38 @@ class play_music(SoundAction):
         pygame.mixer.music.play(loop_count)
         self.scene.active_music = self
 
+        # Sleep until the music stream posts its end event instead of checking it every frame. Looping music never
+        # finishes on its own
+        length = None
+        if not self.action_data["loop"] and Settings.getInstance().headless:
+            length = self.GetMusicLength()
+        self.SleepUntilFinished(self.GetMusicEndEvent(), length)
+
         return None
 
-    def Update(self, events):
-        if not pygame.mixer.music.get_busy():
-            print("SFX completed")
+    def Wake(self, event):
+        # Stopping the previous music posts an end event as well, which may arrive after this music has started
+        if event is not None and pygame.mixer.music.get_busy():
+            self.a_manager.SleepUntilEvent(self, event.type)
+        else:
+            if event is None:
+                # The music's length has passed in simulated time. Stop it, as the device plays it in real time
+                pygame.mixer.music.stop()
+            if self.scene.active_music is self:
+                self.scene.active_music = None
             self.Complete()
 
+    def GetMusicLength(self) -> float:
+        """
+        Returns the length of the music in seconds. The music stream can't report its length, so the music is decoded
+        in full to measure it. Lengths are cached, as this is slow for long tracks
+        """
+        if self.action_data["music"] not in self.music_lengths:
+            music = pygame.mixer.Sound(io.BytesIO(AssetCache.getInstance().GetFileData(self.action_data["music"])))
+            self.music_lengths[self.action_data["music"]] = music.get_length()
+
+        return self.music_lengths[self.action_data["music"]]
+
 class stop_music(Action):
     """
     Stops the currently active music
@@ -1039,9 +961,12 @@ class stop_music(Action):
     def Start(self):
         self.skippable = False
 
-        pygame.mixer.music.stop()  # This will invoke the end-event on the existing music action
-        self.scene.active_music.complete = True
-        self.scene.active_music = None  # DEBUG: Remove once the end-event is implemented
+        # Stopping the music posts its end event, but the music action is completed right away so it doesn't linger
+        # until the event arrives
+        pygame.mixer.music.stop()
+        if self.scene.active_music:
+            self.scene.active_music.Complete()
+            self.scene.active_music = None
         self.Complete()
 
 # -------------- UTILITY ACTIONS --------------
@@ -1068,18 +993,13 @@ class wait(Action):
     Waits for a set amount of time before completing
     """
     def Start(self):
-        self.counter = 0
-        self.target = self.action_data["seconds"]
+        # Sleep until the time has passed, rather than counting it down each frame
+        self.a_manager.Sleep(self, self.action_data["seconds"])
 
         return None
 
-    def Update(self, events):
-        self.counter += 1 * self.scene.delta_time
-        print(self.counter)
-
-        if self.counter >= self.target:
-            print("Times up!")
-            self.Complete()
+    def Wake(self, event):
+        self.Complete()
 
     def Skip(self):
         self.Complete()
@@ -1102,53 +1022,61 @@ those listed in the 'transitions' file
 
 class fade_scene_from_black(Action):
     """
-    Creates a black texture covering the entire screen, then slowly fades it out. Returns 'SpriteRenderable'
+    Covers the entire screen in a solid color (Black by default), then slowly fades it out. The overlay is removed
+    once the fade completes. Returns 'ColorRenderable'
     Possible Parameters:
     - z_order : int <GLOBAL_AVAILABLE>
     - speed: int <GLOBAL_AVAILABLE>
+    - color: tuple
     """
-    def Start(self):
-
-        # Action-specific adjustments
-        self.action_data['position'] = (0, 0)
-        self.action_data['key'] = 'Transition'
-        self.action_data['center_align'] = False
-        self.action_data['sprite'] = "HBEngine/Content/Sprites/TransitionEffects/transition_fade_black.png"
-
-        # PROJECT DEFAULTS OVERRIDE
-        if 'z_order' not in self.action_data:
-            self.action_data['z_order'] = Settings.getInstance().project_settings['Scene Transitions']['z_order']
+    defaults = {
+        "z_order": ProjectSetting("Scene Transitions", "z_order"),
+        "speed": ProjectSetting("Scene Transitions", "speed"),
+        "color": (0, 0, 0)
+    }
+    overrides = {
+        "position": (0, 0),
+        "key": "Transition",
+        "center_align": False
+    }
 
-        if 'speed' not in self.action_data:
-            self.speed = Settings.getInstance().project_settings['Scene Transitions']['speed']
-        else:
-            self.speed = self.action_data['speed']
+    def Start(self):
+        self.speed = self.action_data['speed']
 
-        new_sprite = SpriteRenderable(
+        # A solid fill is used rather than an image, so each step of the fade is a single blend over a cached
+        # copy of the scene (See 'Scene.BeginFade')
+        overlay = ColorRenderable(
             self.scene,
             self.action_data
         )
 
-        self.scene.active_renderables.Add(new_sprite)
-        self.scene.Draw()
+        self.scene.active_renderables.Add(overlay)
+        self.scene.BeginFade(overlay)
+        self.scene.RequestDraw()
 
-        self.renderable = new_sprite
+        self.renderable = overlay
         self.progress = self.renderable.GetSurface().get_alpha()
         self.goal = 0
 
-        return new_sprite
+        return overlay
 
     def Update(self, events):
         self.progress -= (self.speed * self.scene.delta_time)
-        self.renderable.GetSurface().set_alpha(self.progress)
+        self.renderable.SetAlpha(self.progress)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
 
         if self.progress <= self.goal:
             print("Transition Complete")
-            self.Complete()
+            self.Finish()
 
     def Skip(self):
-        self.renderable.GetSurface().set_alpha(self.goal)
-        self.scene.Draw()
+        self.renderable.SetAlpha(self.goal)
+        self.scene.RequestDraw()
+        self.Finish()
+
+    def Finish(self):
+        """ Remove the now invisible overlay, and complete the action """
+        self.scene.EndFade(self.renderable)
+        self.scene.active_renderables.Remove(self.renderable.key)
         self.Complete()
@@ -0,0 +1,287 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import io
+import threading
+from collections import OrderedDict
+import pygame
+from HBEngine.Core.settings import Settings
+
+
+class AssetCache:
+    """
+    A singleton that loads assets once, and hands out the same object to every renderable that requests it. Images
+    are decoded and converted a single time, and kept in a least-recently-used cache limited by memory size.
+    Scaled and flipped variants of cached images are cached the same way, so renderables using the same image at the
+    same size share a single variant. Sounds, and the raw data of streamed files (Music and fonts) are cached in the
+    same way. Fonts are cached per size, and are never evicted
+
+    Surfaces returned from the cache are shared, so they must not be modified directly. Renderables that need to
+    modify a surface (Such as changing its alpha) must make their own copy first
+
+    Assets can be prefetched from a worker thread (See 'AssetPrefetcher'). Images decoded ahead of time are stored
+    unconverted, as converting requires the display, and are converted by the main thread when first requested
+    """
+    __instance = None
+
+    @staticmethod
+    def getInstance():
+        """
+        Static access method - Used to acquire the singleton instance, or instantiate it if it doesn't already exist
+        """
+        if AssetCache.__instance is None:
+            AssetCache()
+        return AssetCache.__instance
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        # Enforce the use of the singleton instance
+        if AssetCache.__instance is not None:
+            raise Exception("This class is a singleton!")
+        else:
+            AssetCache.__instance = self
+
+        # Cached assets are stored in least to most recently used order, alongside their size in bytes. Surfaces are
+        # keyed by (path, size, flipped), where a size of 'None' is the original image size. Other assets are keyed by
+        # (type, path), where the type is one of 'decoded' (Prefetched, unconverted images), 'sound' or 'file'
+        self.assets = OrderedDict()
+
+        # Maps each cached surface to its key so variants can be requested using only the surface
+        self.surface_keys = {}
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+
+        # Fonts are keyed by (path, size)
+        self.fonts = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        # Assets may be prefetched from a worker thread, so all cache access is synchronized
+        self.lock = threading.RLock()
+
+    def GetImage(self, partial_path) -> pygame.Surface:
+        """ Return the converted surface for the provided image path, loading it if it isn't already cached """
+        return self.GetCachedImage((Settings.getInstance().ConvertPartialToAbsolutePath(partial_path), None, False))
+
+    def GetScaledImage(self, surface, size) -> pygame.Surface:
+        """
+        Return a copy of the provided surface scaled to the provided size. If the surface came from this cache, the
+        scaled copy is cached as well
+        """
+        with self.lock:
+            key = self.surface_keys.get(id(surface))
+        if key is None:
+            return pygame.transform.smoothscale(surface, size)
+
+        return self.GetCachedImage((key[0], tuple(size), key[2]))
+
+    def GetFlippedImage(self, surface) -> pygame.Surface:
+        """
+        Return a horizontally flipped copy of the provided surface. If the surface came from this cache, the
+        flipped copy is cached as well
+        """
+        with self.lock:
+            key = self.surface_keys.get(id(surface))
+        if key is None:
+            return pygame.transform.flip(surface, True, False)
+
+        return self.GetCachedImage((key[0], key[1], not key[2]))
+
+    def GetCachedImage(self, key) -> pygame.Surface:
+        """ Return the surface for the provided (path, size, flipped) key, building it if it isn't already cached """
+        with self.lock:
+            cached_asset = self.GetCachedAsset(key)
+            if cached_asset is not None:
+                return cached_asset
+
+            path, size, flipped = key
+
+            # Variants are built from the next simplest variant, which is cached in turn. Scaling and flipping produce
+            # the same result in either order, so flipping is always applied to the original size
+            if size is not None:
+                surface = pygame.transform.smoothscale(self.GetCachedImage((path, None, flipped)), size)
+            elif flipped:
+                surface = pygame.transform.flip(self.GetCachedImage((path, None, False)), True, False)
+            else:
+                # Use the prefetched image if there is one, otherwise load it from scratch
+                decoded = self.assets.pop(("decoded", path), None)
+                if decoded is not None:
+                    self.used_bytes -= decoded[1]
+                    surface = decoded[0].convert_alpha()
+                else:
+                    surface = self.LoadImage(path).convert_alpha()
+
+            self.StoreAsset(key, surface, self.GetSurfaceSize(surface))
+            self.surface_keys[id(surface)] = key
+            return surface
+
+    def GetSound(self, partial_path) -> pygame.mixer.Sound:
+        """ Return the sound object for the provided sound path, loading it if it isn't already cached """
+        key = ("sound", Settings.getInstance().ConvertPartialToAbsolutePath(partial_path))
+
+        with self.lock:
+            sound = self.GetCachedAsset(key)
+            if sound is None:
+                sound = self.LoadSound(key[1])
+                self.StoreAsset(key, sound, self.GetSoundSize(sound))
+
+            return sound
+
+    def GetFileData(self, partial_path) -> bytes:
+        """
+        Return the raw contents of the provided file path, reading it if it isn't already cached. This is used for
+        assets that are streamed from a file object, such as music and fonts
+        """
+        key = ("file", Settings.getInstance().ConvertPartialToAbsolutePath(partial_path))
+
+        with self.lock:
+            data = self.GetCachedAsset(key)
+            if data is None:
+                data = self.LoadFile(key[1])
+                self.StoreAsset(key, data, len(data))
+
+            return data
+
+    def PrefetchImage(self, path):
+        """ Decode the image at the provided absolute path ahead of time. Safe to call from a worker thread """
+        with self.lock:
+            if (path, None, False) in self.assets or ("decoded", path) in self.assets:
+                return
+
+        # Decode outside of the lock so the main thread isn't blocked in the meantime
+        surface = self.LoadImage(path)
+        with self.lock:
+            self.StoreAsset(("decoded", path), surface, self.GetSurfaceSize(surface))
+
+    def PrefetchSound(self, path):
+        """ Decode the sound at the provided absolute path ahead of time. Safe to call from a worker thread """
+        with self.lock:
+            if ("sound", path) in self.assets:
+                return
+
+        sound = self.LoadSound(path)
+        with self.lock:
+            self.StoreAsset(("sound", path), sound, self.GetSoundSize(sound))
+
+    def PrefetchFile(self, path):
+        """ Read the file at the provided absolute path ahead of time. Safe to call from a worker thread """
+        with self.lock:
+            if ("file", path) in self.assets:
+                return
+
+        data = self.LoadFile(path)
+        with self.lock:
+            self.StoreAsset(("file", path), data, len(data))
+
+    def LoadImage(self, path) -> pygame.Surface:
+        """ Decode the image at the provided absolute path, which may be stored in the asset pack """
+        with Settings.getInstance().OpenAsset(path) as f:
+            # The path is provided as a name hint so the image format can be determined from its extension
+            return pygame.image.load(f, path)
+
+    def LoadSound(self, path) -> pygame.mixer.Sound:
+        """ Decode the sound at the provided absolute path, which may be stored in the asset pack """
+        with Settings.getInstance().OpenAsset(path) as f:
+            return pygame.mixer.Sound(file=f)
+
+    def LoadFile(self, path) -> bytes:
+        """ Read the contents of the provided absolute path, which may be stored in the asset pack """
+        with Settings.getInstance().OpenAsset(path) as f:
+            return f.read()
+
+    def IsCached(self, key) -> bool:
+        """ Returns whether the provided key is cached, or is waiting to be converted after being prefetched """
+        with self.lock:
+            return key in self.assets or (len(key) == 3 and ("decoded", key[0]) in self.assets)
+
+    def GetCachedAsset(self, key):
+        """ Return the cached asset for the provided key, marking it as recently used. Returns None if not cached """
+        if key in self.assets:
+            self.hits += 1
+            self.assets.move_to_end(key)
+            return self.assets[key][0]
+
+        self.misses += 1
+        return None
+
+    def StoreAsset(self, key, asset, size):
+        """ Add the provided asset to the cache, evicting the least recently used assets if over budget """
+        self.assets[key] = (asset, size)
+        self.used_bytes += size
+
+        # Always keep the newest asset, even if it alone exceeds the budget
+        while self.used_bytes > self.max_bytes and len(self.assets) > 1:
+            evicted_asset, evicted_size = self.assets.popitem(last=False)[1]
+            self.surface_keys.pop(id(evicted_asset), None)
+            self.used_bytes -= evicted_size
+
+    def GetSurfaceSize(self, surface) -> int:
+        """ Returns the memory size of the provided surface in bytes """
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    def GetSoundSize(self, sound) -> int:
+        """ Returns the approximate memory size of the provided sound in bytes """
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+
+    def GetFont(self, partial_path, size) -> pygame.font.Font:
+        """ Return the font object for the provided font path and size, loading it if it isn't already cached """
+        key = (Settings.getInstance().ConvertPartialToAbsolutePath(partial_path), size)
+
+        with self.lock:
+            if key in self.fonts:
+                self.hits += 1
+                return self.fonts[key]
+
+            # Fonts are read from the cached file data, which may have been prefetched. The font keeps the file object
+            # alive for as long as it needs it
+            self.misses += 1
+            font = pygame.font.Font(io.BytesIO(self.GetFileData(partial_path)), size)
+            self.fonts[key] = font
+
+            return font
+
+    def PreloadProjectFonts(self):
+        """
+        Load the fonts referenced by the project settings ahead of time. Each '<prefix>font' setting is paired with
+        its '<prefix>text_size' setting (Or 'size' when there is no prefix)
+        """
+        for section in ("Text", "Button", "Dialogue", "Choice"):
+            section_data = Settings.getInstance().project_settings.get(section, {})
+
+            for key, value in section_data.items():
+                if key.endswith("font"):
+                    size_key = key[:-len("font")] + "text_size"
+                    if size_key not in section_data:
+                        size_key = "size"
+
+                    if size_key in section_data:
+                        self.GetFont(value, section_data[size_key])
+
+    def Clear(self):
+        """ Remove all cached assets. Any renderables using them keep their references """
+        with self.lock:
+            self.assets.clear()
+            self.surface_keys.clear()
+            self.fonts.clear()
+            self.used_bytes = 0
+
+    def GetStats(self) -> dict:
+        """ Returns a dict of cache usage statistics """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.assets) + len(self.fonts),
+            "bytes": self.used_bytes
+        }
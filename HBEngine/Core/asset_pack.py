@@ -0,0 +1,176 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+
+
+class AssetPack:
+    """
+    A read-only archive of asset files, allowing builds to ship a single file instead of thousands of loose ones. The
+    archive is memory-mapped, so files are read directly from the mapping without being opened individually
+
+    Format:
+        - Header: The magic bytes 'HBPK', the format version (uint32), and the byte length of the index (uint32)
+        - Index: A JSON list of [path, offset, length, hash] entries. Offsets are relative to the start of the data
+        - Data: The contents of each file. Files with identical contents are only stored once
+
+    Paths are stored as the partial paths used in data files (Such as 'Content/Sprites/Sprite.png', or
+    'HBEngine/Content/...' for engine files)
+    """
+    magic = b"HBPK"
+    version = 1
+    header_format = "<4sII"
+
+    def __init__(self, pack_path):
+        self.pack_path = pack_path
+        self.file = open(pack_path, "rb")
+        self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.mapping)
+
+        magic, version, index_length = struct.unpack_from(self.header_format, self.buffer)
+        if magic != self.magic:
+            raise ValueError(f"'{pack_path}' is not an asset pack")
+        if version != self.version:
+            raise ValueError(f"Asset pack '{pack_path}' uses unsupported version {version}")
+
+        index_start = struct.calcsize(self.header_format)
+        data_start = index_start + index_length
+
+        # Entries are keyed by path, and store (absolute offset, length, hash)
+        self.entries = {}
+        for path, offset, length, file_hash in json.loads(bytes(self.buffer[index_start:data_start])):
+            self.entries[path] = (data_start + offset, length, file_hash)
+
+    def Contains(self, path) -> bool:
+        """ Returns whether the provided partial path is stored in the pack """
+        return path in self.entries
+
+    def GetBuffer(self, path) -> memoryview:
+        """ Returns a view of the contents of the provided path. The view references the mapping directly """
+        offset, length, file_hash = self.entries[path]
+        return self.buffer[offset:offset + length]
+
+    def GetHash(self, path) -> str:
+        """ Returns the hash of the contents of the provided path, as recorded when the pack was built """
+        return self.entries[path][2]
+
+    def Open(self, path) -> "PackedFile":
+        """ Returns a read-only file object for the provided path """
+        return PackedFile(self.GetBuffer(path))
+
+    def Close(self):
+        """
+        Release the mapping and the underlying file. Views of packed files that are still in use (Such as the file
+        objects fonts and music are streamed from) keep the mapping alive until they're released
+        """
+        self.buffer.release()
+        try:
+            self.mapping.close()
+        except BufferError:
+            # The mapping can't be closed while views into it exist. It's closed once the last of them is released
+            pass
+        self.file.close()
+
+    def Verify(self) -> list:
+        """ Returns the list of paths whose contents don't match their recorded hash """
+        return [
+            path for path, (offset, length, file_hash) in self.entries.items()
+            if hashlib.sha1(self.buffer[offset:offset + length]).hexdigest() != file_hash
+        ]
+
+    @staticmethod
+    def Build(pack_path, source_dirs: dict, excluded_extensions=()) -> int:
+        """
+        Write an asset pack containing every file in the provided directories. 'source_dirs' maps each directory to
+        the partial path prefix its files are stored under (Such as {'<project>/Content': 'Content'}). Files with an
+        excluded extension are skipped. Returns the number of files that were packed
+        """
+        index = []
+        data_offsets = {}  # Offsets of already stored file contents, keyed by hash
+        data_length = 0
+
+        with io.BytesIO() as data:
+            for source_dir, prefix in source_dirs.items():
+                for root, dirs, files in os.walk(source_dir):
+                    dirs.sort()
+                    for file_name in sorted(files):
+                        if os.path.splitext(file_name)[1].lower() in excluded_extensions:
+                            continue
+
+                        file_path = os.path.join(root, file_name)
+                        relative_path = os.path.relpath(file_path, source_dir).replace("\\", "/")
+                        with open(file_path, "rb") as f:
+                            contents = f.read()
+
+                        file_hash = hashlib.sha1(contents).hexdigest()
+                        if file_hash not in data_offsets:
+                            data_offsets[file_hash] = data_length
+                            data.write(contents)
+                            data_length += len(contents)
+
+                        index.append([f"{prefix}/{relative_path}", data_offsets[file_hash], len(contents), file_hash])
+
+            index_data = json.dumps(index).encode("utf-8")
+            with open(pack_path, "wb") as f:
+                f.write(struct.pack(AssetPack.header_format, AssetPack.magic, AssetPack.version, len(index_data)))
+                f.write(index_data)
+                f.write(data.getbuffer())
+
+        return len(index)
+
+
+class PackedFile(io.RawIOBase):
+    """
+    A read-only, seekable file object over a file stored in an 'AssetPack'. This can be provided anywhere pygame
+    accepts a file object (Images, sounds, fonts and music)
+    """
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        length = min(len(target), len(self.buffer) - self.position)
+        target[:length] = self.buffer[self.position:self.position + length]
+        self.position += length
+        return length
+
+    def read(self, size=-1) -> bytes:
+        if size is None or size < 0:
+            size = len(self.buffer) - self.position
+        data = bytes(self.buffer[self.position:self.position + size])
+        self.position += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
@@ -0,0 +1,122 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import queue
+import threading
+import pygame
+from HBEngine.Core.settings import Settings
+from HBEngine.Core.asset_cache import AssetCache
+
+
+class AssetPrefetcher:
+    """
+    A singleton that loads assets into the 'AssetCache' from a worker thread, ahead of the actions that use them. This
+    moves disk access and decoding off the main thread, so actions find their assets ready when they start
+
+    Prefetching is best-effort. Assets that fail to load are skipped, and are loaded (Raising the usual errors) by the
+    action that uses them instead
+    """
+    __instance = None
+
+    # Action data keys that reference assets, and the type of asset they reference
+    asset_keys = {
+        "sprite": "image",
+        "sprite_hover": "image",
+        "sprite_clicked": "image",
+        "sound": "sound",
+        "music": "file",
+        "font": "file"
+    }
+
+    @staticmethod
+    def getInstance():
+        """
+        Static access method - Used to acquire the singleton instance, or instantiate it if it doesn't already exist
+        """
+        if AssetPrefetcher.__instance is None:
+            AssetPrefetcher()
+        return AssetPrefetcher.__instance
+
+    def __init__(self):
+        # Enforce the use of the singleton instance
+        if AssetPrefetcher.__instance is not None:
+            raise Exception("This class is a singleton!")
+        else:
+            AssetPrefetcher.__instance = self
+
+        # Queued (asset type, absolute path) pairs. Paths that are queued or being loaded are tracked so they are only
+        # requested once
+        self.queue = queue.Queue()
+        self.pending = set()
+        self.lock = threading.Lock()
+
+        # The worker is started the first time something is queued
+        self.worker = None
+
+    def PrefetchData(self, data):
+        """ Queue every asset referenced by the provided action data, including any nested data """
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key in self.asset_keys and isinstance(value, str):
+                    self.Prefetch(self.asset_keys[key], value)
+                else:
+                    self.PrefetchData(value)
+        elif isinstance(data, (list, tuple)):
+            for value in data:
+                self.PrefetchData(value)
+
+    def Prefetch(self, asset_type, partial_path):
+        """ Queue the asset at the provided path to be loaded by the worker thread, if it isn't already cached """
+        path = Settings.getInstance().ConvertPartialToAbsolutePath(partial_path)
+        if asset_type == "image":
+            key = (path, None, False)
+        else:
+            key = (asset_type, path)
+
+        if AssetCache.getInstance().IsCached(key):
+            return
+
+        with self.lock:
+            if (asset_type, path) in self.pending:
+                return
+            self.pending.add((asset_type, path))
+
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.Run, name="AssetPrefetcher", daemon=True)
+                self.worker.start()
+
+        self.queue.put((asset_type, path))
+
+    def Run(self):
+        """ Load queued assets into the asset cache. Runs on the worker thread for the lifetime of the program """
+        while True:
+            asset_type, path = self.queue.get()
+            try:
+                if asset_type == "image":
+                    AssetCache.getInstance().PrefetchImage(path)
+                elif asset_type == "sound":
+                    AssetCache.getInstance().PrefetchSound(path)
+                else:
+                    AssetCache.getInstance().PrefetchFile(path)
+            except (pygame.error, OSError) as exc:
+                print(f"Failed to prefetch '{path}': {exc}")
+            finally:
+                with self.lock:
+                    self.pending.discard((asset_type, path))
+                self.queue.task_done()
+
+    def WaitUntilIdle(self):
+        """ Block until every queued asset has been loaded """
+        if self.worker is not None:
+            self.queue.join()
@@ -0,0 +1,172 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import csv
+import json
+import time
+import pygame
+
+
+class FrameProfiler:
+    """
+    A singleton that records how long each frame spends in each part of the game loop. Samples are kept in a
+    fixed-size ring buffer so the cost of profiling never grows, and can be summarized as percentiles, drawn as an
+    on-screen overlay, or dumped to disk
+
+    Time is attributed to sections using marks: calling 'Mark' assigns all time since the previous mark (Or the start
+    of the frame) to the provided section
+    """
+    __instance = None
+
+    sections = ("events", "renderables", "actions", "draw", "display")
+    percentiles = (50, 95, 99)
+
+    @staticmethod
+    def getInstance():
+        """
+        Static access method - Used to acquire the singleton instance, or instantiate it if it doesn't already exist
+        """
+        if FrameProfiler.__instance is None:
+            FrameProfiler()
+        return FrameProfiler.__instance
+
+    def __init__(self, capacity=600):
+        # Enforce the use of the singleton instance
+        if FrameProfiler.__instance is not None:
+            raise Exception("This class is a singleton!")
+        else:
+            FrameProfiler.__instance = self
+
+        # Each sample is a tuple of section times followed by the total frame time, in seconds
+        self.capacity = capacity
+        self.samples = [None] * capacity
+        self.sample_index = 0
+        self.sample_count = 0
+
+        self.frame_start = 0
+        self.last_mark = 0
+        self.active_sample = [0.0] * len(self.sections)
+
+        # The overlay is only rebuilt periodically, as summarizing the samples every frame would skew the results
+        self.overlay_font = None
+        self.overlay_surface = None
+        self.overlay_rect = None
+        self.overlay_refresh_rate = 15
+        self.overlay_frames_since_refresh = 0
+
+    def BeginFrame(self):
+        """ Start recording a new frame """
+        self.frame_start = time.perf_counter()
+        self.last_mark = self.frame_start
+        self.active_sample = [0.0] * len(self.sections)
+
+    def Mark(self, section):
+        """ Assign the time elapsed since the previous mark to the provided section """
+        now = time.perf_counter()
+        self.active_sample[self.sections.index(section)] += now - self.last_mark
+        self.last_mark = now
+
+    def EndFrame(self):
+        """ Store the active frame in the ring buffer, overwriting the oldest sample if the buffer is full """
+        self.active_sample.append(time.perf_counter() - self.frame_start)
+        self.samples[self.sample_index] = tuple(self.active_sample)
+        self.sample_index = (self.sample_index + 1) % self.capacity
+        self.sample_count = min(self.sample_count + 1, self.capacity)
+
+    def GetSamples(self) -> list:
+        """ Returns the stored samples in the order they were recorded (Oldest to newest) """
+        if self.sample_count < self.capacity:
+            return self.samples[:self.sample_count]
+        return self.samples[self.sample_index:] + self.samples[:self.sample_index]
+
+    def GetSummary(self) -> dict:
+        """ Returns a dict of '<section>: {<percentile>: <milliseconds>}' for each section, and the frame total """
+        summary = {}
+        samples = self.GetSamples()
+        if not samples:
+            return summary
+
+        for column, section in enumerate(self.sections + ("total",)):
+            values = sorted(sample[column] for sample in samples)
+            summary[section] = {
+                f"p{percentile}": values[min(len(values) - 1, len(values) * percentile // 100)] * 1000
+                for percentile in self.percentiles
+            }
+
+        return summary
+
+    def Dump(self, file_path):
+        """
+        Write the stored samples and their summary to the provided file path. The format is chosen based on the file
+        extension ('.json' or '.csv'). Times are stored in milliseconds
+        """
+        columns = self.sections + ("total",)
+        rows = [[value * 1000 for value in sample] for sample in self.GetSamples()]
+
+        if file_path.endswith(".csv"):
+            with open(file_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(rows)
+        else:
+            with open(file_path, "w") as f:
+                json.dump(
+                    {
+                        "summary": self.GetSummary(),
+                        "columns": columns,
+                        "samples": rows
+                    },
+                    f,
+                    indent=4
+                )
+
+        print(f"Frame profile written to: {file_path}")
+
+    def DrawOverlay(self, window, extra_lines=None) -> pygame.Rect:
+        """
+        Draw the percentile summary in the top left of the provided window. Returns the rect covered by the overlay
+        """
+        if self.overlay_surface is None or self.overlay_frames_since_refresh >= self.overlay_refresh_rate:
+            self.overlay_surface = self.BuildOverlay(extra_lines)
+            self.overlay_rect = self.overlay_surface.get_rect()
+            self.overlay_frames_since_refresh = 0
+        self.overlay_frames_since_refresh += 1
+
+        window.blit(self.overlay_surface, self.overlay_rect)
+        return self.overlay_rect
+
+    def BuildOverlay(self, extra_lines=None) -> pygame.Surface:
+        """ Render the percentile summary into a new surface. Each value is rendered into its own column """
+        if not self.overlay_font:
+            self.overlay_font = pygame.font.Font(None, 20)
+
+        rows = [["section"] + [f"p{percentile}" for percentile in self.percentiles]]
+        for section, values in self.GetSummary().items():
+            rows.append([section] + [f"{value:.2f}" for value in values.values()])
+
+        line_height = self.overlay_font.get_linesize()
+        column_width = 70
+        line_count = len(rows) + len(extra_lines or [])
+        surface = pygame.Surface((column_width * (len(self.percentiles) + 1) + 10, line_height * line_count + 10))
+
+        for row_index, row in enumerate(rows):
+            for column_index, cell in enumerate(row):
+                image = self.overlay_font.render(cell, True, (255, 255, 255))
+                surface.blit(image, (5 + column_index * column_width, 5 + row_index * line_height))
+
+        for line_index, line in enumerate(extra_lines or []):
+            image = self.overlay_font.render(line, True, (255, 255, 255))
+            surface.blit(image, (5, 5 + (len(rows) + line_index) * line_height))
+
+        return surface
@@ -0,0 +1,145 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import pygame
+from HBEngine.Core.input_router import InputRouter
+
+
+class HitTestService:
+    """
+    Tracks which interactable in a scene is under the mouse. Interactables are indexed in a uniform grid by their rect,
+    so each mouse event only tests the interactables in a single cell. Only the topmost hit (By render order) reacts,
+    so overlapping interactables don't all respond at once
+
+    The service is driven by mouse events (Through the 'InputRouter') rather than polling, so a still mouse costs
+    nothing regardless of how many interactables exist. When the index changes under a still mouse (Such as a button
+    appearing beneath it), the last known mouse position is tested again
+    """
+    def __init__(self, scene, cell_size=128):
+        self.scene = scene
+        self.cell_size = cell_size
+
+        # Grid cells are keyed by (column, row), and hold the interactables overlapping them. 'indexed_cells' maps each
+        # interactable to the cells it's stored in, so it can be moved or removed without searching
+        self.cells = {}
+        self.indexed_cells = {}
+
+        self.mouse_pos = None
+        self.hovered = None  # The topmost interactable under the mouse
+        self.pressed = None  # The interactable the left mouse button was pressed on, if still held
+        self.index_changed = False
+
+    def Subscribe(self):
+        """ Subscribe to the mouse events used to drive hit testing. The subscriptions are owned by the scene """
+        InputRouter.getInstance().Subscribe(pygame.MOUSEMOTION, self.OnMouseMotion, owner=self.scene)
+        InputRouter.getInstance().Subscribe(pygame.MOUSEBUTTONDOWN, self.OnMouseButtonDown, owner=self.scene)
+        InputRouter.getInstance().Subscribe(pygame.MOUSEBUTTONUP, self.OnMouseButtonUp, owner=self.scene)
+
+    def OnMouseMotion(self, event):
+        self.SetMousePosition(event.pos)
+
+    def OnMouseButtonDown(self, event):
+        if event.button == 1:
+            self.SetMousePosition(event.pos)
+            self.pressed = self.hovered
+
+    def OnMouseButtonUp(self, event):
+        if event.button == 1:
+            self.SetMousePosition(event.pos)
+
+            # A click requires the button to be both pressed and released over the same interactable
+            clicked = self.pressed
+            self.pressed = None
+            if clicked is not None and clicked is self.hovered:
+                clicked.Interact()
+
+    def Update(self):
+        """ If the index changed since the last mouse event, test the last known mouse position again """
+        if self.index_changed:
+            if self.mouse_pos is None and pygame.mouse.get_focused():
+                self.mouse_pos = pygame.mouse.get_pos()
+            if self.mouse_pos is not None:
+                self.SetMousePosition(self.mouse_pos)
+            self.index_changed = False
+
+    def SetMousePosition(self, pos):
+        """ Record the mouse position, and move the hover to the topmost interactable beneath it """
+        self.mouse_pos = tuple(pos)
+        self.index_changed = False
+
+        hit = self.HitTest(self.mouse_pos)
+        if hit is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.SetHovered(False)
+            if hit is not None:
+                hit.SetHovered(True)
+            self.hovered = hit
+
+    def HitTest(self, pos):
+        """ Returns the topmost interactable at the provided screen position, or None if there isn't one """
+        cell = (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        renderables = self.scene.active_renderables
+
+        hit = None
+        hit_order = None
+        for interactable in self.cells.get(cell, ()):
+            # Interactables may be indexed before they're added to the scene
+            if renderables.renderables.get(interactable.key) is not interactable:
+                continue
+            if not interactable.visible or not interactable.rect.collidepoint(pos):
+                continue
+            if not interactable.HitTestPixel(pos):
+                continue
+
+            render_order = renderables.sort_key_lookup[interactable.key]
+            if hit_order is None or render_order > hit_order:
+                hit = interactable
+                hit_order = render_order
+
+        return hit
+
+    def Add(self, interactable):
+        """ Index the provided interactable by its rect, replacing any previous entry """
+        self.Remove(interactable)
+
+        rect = interactable.rect
+        cells = [
+            (column, row)
+            for column in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1)
+            for row in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1)
+        ]
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(interactable)
+        self.indexed_cells[interactable] = cells
+
+        self.index_changed = True
+
+    def Remove(self, interactable):
+        """ Remove the provided interactable from the index, if present """
+        cells = self.indexed_cells.pop(interactable, None)
+        if cells is None:
+            return
+
+        for cell in cells:
+            cell_contents = self.cells[cell]
+            cell_contents.discard(interactable)
+            if not cell_contents:
+                del self.cells[cell]
+
+        if interactable is self.hovered:
+            self.hovered = None
+        if interactable is self.pressed:
+            self.pressed = None
+
+        self.index_changed = True
@@ -0,0 +1,157 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import pygame
+from HBEngine.Core.settings import Settings
+
+
+class InputRouter:
+    """
+    A singleton that dispatches each input event once to the handlers subscribed to it, instead of every system
+    scanning the full event list each frame. Handlers subscribe to an event type, optionally narrowed to a single key,
+    and are called from the highest priority to the lowest. A handler that returns True consumes the event, and it
+    isn't passed to any further handlers
+
+    Keys can be subscribed to through named bindings, which projects can rebind in the 'Input' section of 'Game.yaml'
+    using pygame key names (Such as 'K_SPACE'), or a list of them
+
+    Bursts of consecutive MOUSEMOTION events are coalesced into a single event before being dispatched
+    """
+    __instance = None
+
+    # The key each binding uses when the project doesn't rebind it
+    default_bindings = {
+        "continue": "K_SPACE",
+        "pause": "K_p",
+        "fullscreen": "K_1",
+        "windowed": "K_2",
+        "exit": "K_ESCAPE",
+        "toggle_profiler": "K_F3",
+        "dump_profile": "K_F4"
+    }
+
+    @staticmethod
+    def getInstance():
+        """
+        Static access method - Used to acquire the singleton instance, or instantiate it if it doesn't already exist
+        """
+        if InputRouter.__instance is None:
+            InputRouter()
+        return InputRouter.__instance
+
+    def __init__(self):
+        # Enforce the use of the singleton instance
+        if InputRouter.__instance is not None:
+            raise Exception("This class is a singleton!")
+        else:
+            InputRouter.__instance = self
+
+        # Subscriptions are keyed by (event type, key), where a key of None matches every event of that type. Each
+        # holds a list of [priority, subscription index, handler, owner, active] entries sorted from highest priority
+        # to lowest
+        self.subscriptions = {}
+        self.subscription_count = 0
+
+    def Subscribe(self, event_type, handler, key=None, priority=0, owner=None):
+        """
+        Call the provided handler with each event of the provided type (And key, if provided). Handlers with a higher
+        priority are called first, and handlers with the same priority are called in the order they subscribed. The
+        owner can be used to remove all of its subscriptions at once (See 'Unsubscribe')
+        """
+        handlers = self.subscriptions.setdefault((event_type, key), [])
+        handlers.append([priority, self.subscription_count, handler, owner, True])
+        handlers.sort(key=lambda subscription: (-subscription[0], subscription[1]))
+        self.subscription_count += 1
+
+    def SubscribeBinding(self, binding, event_type, handler, priority=0, owner=None):
+        """ Subscribe the provided handler to each key assigned to the provided binding name """
+        for key in self.GetBindingKeys(binding):
+            self.Subscribe(event_type, handler, key, priority, owner)
+
+    def Unsubscribe(self, owner):
+        """ Remove every subscription made by the provided owner """
+        for event_key, handlers in list(self.subscriptions.items()):
+            # The lists may be mid-dispatch, so they're replaced rather than edited in place. Removed subscriptions
+            # are deactivated so an in-progress dispatch skips them
+            remaining = []
+            for subscription in handlers:
+                if subscription[3] is owner:
+                    subscription[4] = False
+                else:
+                    remaining.append(subscription)
+            if remaining:
+                self.subscriptions[event_key] = remaining
+            else:
+                del self.subscriptions[event_key]
+
+    def GetBindingKeys(self, binding) -> list:
+        """ Returns the key codes assigned to the provided binding name, using the project's 'Input' settings """
+        if binding not in self.default_bindings:
+            raise ValueError(f"The provided input binding '{binding}' is invalid. Available bindings: "
+                             f"{', '.join(self.default_bindings)}")
+
+        project_settings = Settings.getInstance().project_settings or {}
+        key_names = project_settings.get("Input", {}).get(binding, self.default_bindings[binding])
+        if isinstance(key_names, str):
+            key_names = [key_names]
+
+        keys = []
+        for key_name in key_names:
+            if not key_name.startswith("K_") or not hasattr(pygame, key_name):
+                raise ValueError(f"The key '{key_name}' assigned to the input binding '{binding}' is invalid. Keys "
+                                 f"use pygame key names, such as 'K_SPACE'")
+            keys.append(getattr(pygame, key_name))
+
+        return keys
+
+    def Dispatch(self, events) -> list:
+        """
+        Pass each of the provided events to its subscribed handlers. Returns the events after coalescing, so they can
+        be provided to systems that still expect the full event list
+        """
+        events = self.CoalesceMouseMotion(events)
+
+        for event in events:
+            handlers = self.subscriptions.get((event.type, getattr(event, "key", None)), [])
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP) and (event.type, None) in self.subscriptions:
+                # Merge the key-specific handlers with those subscribed to every key, keeping the priority order
+                handlers = sorted(
+                    handlers + self.subscriptions.get((event.type, None), []),
+                    key=lambda subscription: (-subscription[0], subscription[1])
+                )
+
+            for subscription in handlers:
+                if subscription[4] and subscription[2](event):
+                    break
+
+        return events
+
+    def CoalesceMouseMotion(self, events) -> list:
+        """
+        Merge each run of consecutive MOUSEMOTION events into one, using the final position and the combined movement.
+        Other events are left in place, so motion is never reordered around clicks
+        """
+        coalesced = []
+        for event in events:
+            if event.type == pygame.MOUSEMOTION and coalesced and coalesced[-1].type == pygame.MOUSEMOTION:
+                previous = coalesced[-1]
+                rel = getattr(previous, "rel", (0, 0))
+                event_rel = getattr(event, "rel", (0, 0))
+                attributes = dict(event.__dict__)
+                attributes["rel"] = (rel[0] + event_rel[0], rel[1] + event_rel[1])
+                coalesced[-1] = pygame.event.Event(pygame.MOUSEMOTION, attributes)
+            else:
+                coalesced.append(event)
+
+        return coalesced
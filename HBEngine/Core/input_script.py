@@ -0,0 +1,60 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import pygame
+from Tools.HBYaml.hb_yaml import Reader
+
+
+class InputScript:
+    """
+    A scripted source of input events, used to drive the engine without a player (Benchmarks, automated testing, etc).
+    Scripts are YAML files containing a list of events, each tagged with the frame they should be delivered on:
+
+        - frame: 60
+          type: KEYUP
+          key: K_SPACE
+        - frame: 90
+          type: MOUSEBUTTONUP
+          button: 1
+          pos: [640, 360]
+
+    'type' and 'key' use the pygame constant names. Any other values are passed through as event attributes
+    """
+    def __init__(self, script_path):
+        self.events = {}
+
+        script_data = Reader.ReadAll(script_path)
+        if script_data:
+            for event_data in script_data:
+                self.events.setdefault(event_data["frame"], []).append(self.CreateEvent(event_data))
+
+    def GetEvents(self, frame) -> list:
+        """ Returns the list of events scheduled for the provided frame """
+        return self.events.get(frame, [])
+
+    def CreateEvent(self, event_data) -> pygame.event.Event:
+        """ Given a scripted event dict, build the corresponding pygame event """
+        attributes = {}
+        for name, value in event_data.items():
+            if name in ("frame", "type"):
+                continue
+            elif name == "key":
+                value = getattr(pygame, value)
+            elif isinstance(value, list):
+                # Pygame uses tuples for positions and movement
+                value = tuple(value)
+
+            attributes[name] = value
+
+        return pygame.event.Event(getattr(pygame, event_data["type"]), attributes)
@@ -12,10 +12,17 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
+import os
+import queue
+import threading
+from concurrent.futures import Future
 from HBEngine.Core.settings import Settings
+from HBEngine.Core.asset_prefetcher import AssetPrefetcher
+from HBEngine.Core.input_router import InputRouter
 from HBEngine.Core.BaseClasses.scene_pointandclick import PointAndClickScene
 from HBEngine.Core.BaseClasses.scene_dialogue import DialogueScene
 from HBEngine.Core.DataTypes.file_types import FileType
+from Tools.HBYaml.hb_yaml import Reader
 
 
 class SceneManager:
@@ -34,6 +41,19 @@ class SceneManager:
             FileType.Scene_Point_And_Click: PointAndClickScene
         }
 
+        # Scenes reachable from the active scene are parsed, and have their assets warmed, in the background. Each
+        # scene file maps to a future holding its parsed data, so switching to it doesn't need to wait on the disk.
+        # Preloads are queued as (future, scene file) pairs for a daemon worker, so a preload still running at quit
+        # never keeps the process alive. The worker is started the first time something is queued
+        self.preload_queue = queue.Queue()
+        self.preload_worker = None
+        self.preloaded_scenes = {}
+
+        # Parsed scene documents, keyed by absolute path, alongside the modification time of the file they were read
+        # from. Scenes receive a copy, as actions modify their data in place. Access is shared with the preload thread
+        self.parsed_scenes = {}
+        self.parsed_scenes_lock = threading.Lock()
+
         # Load the starting scene defined in the project settings
         if not Settings.getInstance().project_settings["Game"]["starting_scene"]:
             raise ValueError("No starting scene was provided in the project settings")
@@ -46,27 +66,151 @@ class SceneManager:
 
     def LoadScene(self, scene_file):
         """ Given a path to a scene file, check it's type, and load the corresponding scene object """
-        # We need to read the file to find it's type. This is denoted by the 'type' value somewhere near the top of the
-        # file. We can't guarentee it's position since the metadata may grow one day, and the line number would shift.
-        scene_type = None
-        with open(Settings.getInstance().ConvertPartialToAbsolutePath(scene_file), "r") as f:
-            for line in f:
-                if line.startswith("type:"):
-                    scene_type = FileType[line.replace("type: ", "").strip()]
-
-        if scene_type is not None:
-            if scene_type in self.scene_types:
-                del self.active_scene
-                self.active_scene = self.scene_types[scene_type](
-                    scene_file,
-                    self.window,
-                    self
-                )
-            else:
-                raise ValueError(f"Failed to Load Scene - Specified scene type does not exist: {scene_type}")
+        # Use the preloaded scene data if this scene was reachable from the previous one. If it's still being
+        # preloaded, this waits for it to finish
+        if scene_file in self.preloaded_scenes:
+            scene_data = self.preloaded_scenes.pop(scene_file).result()
         else:
+            scene_data = self.ReadSceneFile(scene_file)
+
+        Settings.getInstance().ReportMissingAssets(scene_data, scene_file)
+
+        if "type" not in scene_data:
             raise ValueError(f"No scene type specified in file '{scene_file}'")
 
+        scene_type = FileType[scene_data["type"]]
+        if scene_type in self.scene_types:
+            # The outgoing scene no longer receives input
+            if self.active_scene is not None:
+                InputRouter.getInstance().Unsubscribe(self.active_scene)
+
+            del self.active_scene
+            self.active_scene = self.scene_types[scene_type](
+                scene_data,
+                self.window,
+                self
+            )
+        else:
+            raise ValueError(f"Failed to Load Scene - Specified scene type does not exist: {scene_type}")
+
+        self.PreloadNeighbourScenes(scene_data)
+
+    def ReadSceneFile(self, scene_file) -> dict:
+        """
+        Return a copy of the data for the provided scene file. Files are only parsed again if they've been modified
+        since they were last read
+        """
+        path = Settings.getInstance().ConvertPartialToAbsolutePath(scene_file)
+        modified_time = os.path.getmtime(path)
+
+        with self.parsed_scenes_lock:
+            cached_scene = self.parsed_scenes.get(path)
+
+        if cached_scene is None or cached_scene[0] != modified_time:
+            cached_scene = (modified_time, Reader.ReadAll(path, Settings.getInstance().cache_dir))
+            with self.parsed_scenes_lock:
+                self.parsed_scenes[path] = cached_scene
+
+        return self.CopySceneData(cached_scene[1])
+
+    def CopySceneData(self, data):
+        """
+        Return a copy of the provided scene data. Scene data only contains dicts, lists and immutable values, so this is
+        much cheaper than a generic deep copy
+        """
+        if isinstance(data, dict):
+            return {key: self.CopySceneData(value) for key, value in data.items()}
+        elif isinstance(data, (list, tuple)):
+            return [self.CopySceneData(value) for value in data]
+        return data
+
+    def PreloadNeighbourScenes(self, scene_data):
+        """
+        Begin preloading every scene that can be switched to from the provided scene data. Any preloaded scenes that
+        are no longer reachable are discarded, and cancelled if they haven't started preloading yet
+        """
+        neighbour_scenes = {}
+        for scene_file in self.FindSceneFiles(scene_data):
+            if scene_file in self.preloaded_scenes:
+                neighbour_scenes[scene_file] = self.preloaded_scenes.pop(scene_file)
+            elif scene_file not in neighbour_scenes:
+                neighbour_scenes[scene_file] = self.QueuePreload(scene_file)
+
+        for future in self.preloaded_scenes.values():
+            future.cancel()
+
+        self.preloaded_scenes = neighbour_scenes
+
+    def QueuePreload(self, scene_file) -> Future:
+        """ Queue the provided scene file to be preloaded by the worker thread. Returns a future for its data """
+        future = Future()
+        self.preload_queue.put((future, scene_file))
+
+        if self.preload_worker is None:
+            self.preload_worker = threading.Thread(target=self.RunPreloads, name="ScenePreloader", daemon=True)
+            self.preload_worker.start()
+
+        return future
+
+    def RunPreloads(self):
+        """ Preload queued scenes until the manager is shut down. Runs on the worker thread """
+        while True:
+            future, scene_file = self.preload_queue.get()
+            if future is None:
+                return
+
+            # Skip preloads that were cancelled while queued
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(self.PreloadScene(scene_file))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+    def Shutdown(self):
+        """
+        Stop preloading scenes. Queued preloads are cancelled, and a preload that is already running is abandoned
+        """
+        for future in self.preloaded_scenes.values():
+            future.cancel()
+        self.preloaded_scenes.clear()
+
+        self.preload_queue.put((None, None))
+
+    def PreloadScene(self, scene_file) -> dict:
+        """ Read the data for the provided scene file, and queue its assets for prefetching. Runs in the background """
+        scene_data = self.ReadSceneFile(scene_file)
+
+        # Warm everything the scene creates on load. Dialogue is read entry by entry, so only the start of each
+        # branch is warmed
+        for key, value in scene_data.items():
+            if key == "dialogue":
+                for branch in value.values():
+                    AssetPrefetcher.getInstance().PrefetchData(branch["entries"][:DialogueScene.prefetch_depth])
+            else:
+                AssetPrefetcher.getInstance().PrefetchData(value)
+
+        return scene_data
+
+    def FindSceneFiles(self, data) -> list:
+        """
+        Returns the scene files of every 'load_scene' action within the provided data. This includes dialogue entries,
+        as well as the 'action' blocks of interactables
+        """
+        scene_files = []
+        if isinstance(data, dict):
+            if data.get("action") == "load_scene" and "scene_file" in data:
+                scene_files.append(data["scene_file"])
+
+            for value in data.values():
+                scene_files.extend(self.FindSceneFiles(value))
+        elif isinstance(data, (list, tuple)):
+            for value in data:
+                scene_files.extend(self.FindSceneFiles(value))
+
+        return scene_files
+
     def ResizeScene(self):
         """ Inform the scene object o resize to support a resolution change """
         self.active_scene.Resize()
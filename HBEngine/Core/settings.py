@@ -13,13 +13,18 @@
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
 import os
-from Tools.HBYaml.hb_yaml import Reader
+from HBEngine.Core.asset_pack import AssetPack
+from Tools.HBYaml.hb_yaml import Reader, GetUserCacheDir
 
 
 class Settings:
     """ A singleton that holds global project information, and path utility functions """
     __instance = None
 
+    # Data keys ending with any of these reference an asset file (Such as 'sprite', or 'button_sprite_hover' in the
+    # project settings)
+    asset_key_suffixes = ("sprite", "sprite_hover", "sprite_clicked", "font", "sound", "music")
+
     @staticmethod
     def getInstance():
         """
@@ -41,6 +46,22 @@ class Settings:
         self.project_dir = ""
         self.project_settings = None
 
+        # Parsed project data files are cached here in binary form, so they only need to be parsed when they change.
+        # The cache is kept per-user rather than in the project, as its entries are unpickled when loaded
+        self.cache_dir = GetUserCacheDir()
+
+        # Absolute paths keyed by the partial paths they were converted from. Cleared when the project root changes
+        self.absolute_paths = {}
+
+        # Builds may store assets in a single pack file instead of as loose files (See 'AssetPack'). Absolute paths of
+        # packed assets are mapped to the partial path they're stored under
+        self.asset_pack_file = "Assets.hbpack"
+        self.asset_pack = None
+        self.packed_paths = {}
+
+        # Headless runs use simulated time for everything, including audio, so runs are reproducible (See 'HBEngine')
+        self.headless = False
+
         # Some params need to be accessed more immediately than through the settings dict. Declare them here
         self.resolution = None
         self.resolution_options = None
@@ -55,9 +76,22 @@ class Settings:
         else:
             self.project_dir = self.root_dir
 
+        self.absolute_paths.clear()
+        self.packed_paths.clear()
+
+        # Release the previous project's pack before replacing it
+        if self.asset_pack:
+            self.asset_pack.Close()
+
+        pack_path = f"{self.project_dir}/{self.asset_pack_file}"
+        if os.path.isfile(pack_path):
+            self.asset_pack = AssetPack(pack_path)
+        else:
+            self.asset_pack = None
+
     def Evaluate(self, data_path):
         """ Reads in the provided project settings file path """
-        self.project_settings = Reader.ReadAll(data_path)
+        self.project_settings = Reader.ReadAll(data_path, self.cache_dir)
 
         self.resolution = self.project_settings['Window']['resolution']
         self.resolution_options = self.project_settings['Window']['resolution_options']
@@ -70,20 +104,72 @@ class Settings:
         If the provided path has 'ENGINE_FILES' at the beginning, then the returned path will be relative
         to the engine, not the project. This is to allow references to engine default files that are not
         a part of Heartbeat projects
+
+        Converted paths are cached, as the same assets are referenced repeatedly
         """
-        #@TODO: Figure out how to solve this path reference with packaged builds
-        # Context: If using the "main" script to launch the engine from the editor, then the root
-        # will be "<root>/HBEngine", which means to access engine files, you'll need to append another
-        # "HBEngine". This doesn't quite make sense, as this directory struture would likely change for builds
-        # where we won't need the editor, so "main" would be non-existent. At that point, we'd likely start
-        # in the deeper "HBEngine", which doesn't require that additional concatenation
-
-        # Idea 1: We still use main, but we don't package the editor, and in main, we have a flag to skip
-        # the editor (Likely ill-advised)
-        print(os.getcwd())
-        # Idea 2: We modify this code for the build
-        if partial_path.startswith("HBEngine"):
-            return partial_path.replace("HBEngine", f"{self.root_dir}/HBEngine")
-        else:
-            return self.project_dir + "/" + partial_path
+        absolute_path = self.absolute_paths.get(partial_path)
+        if absolute_path is None:
+            #@TODO: Figure out how to solve this path reference with packaged builds
+            # Context: If using the "main" script to launch the engine from the editor, then the root
+            # will be "<root>/HBEngine", which means to access engine files, you'll need to append another
+            # "HBEngine". This doesn't quite make sense, as this directory struture would likely change for builds
+            # where we won't need the editor, so "main" would be non-existent. At that point, we'd likely start
+            # in the deeper "HBEngine", which doesn't require that additional concatenation
+
+            # Idea 1: We still use main, but we don't package the editor, and in main, we have a flag to skip
+            # the editor (Likely ill-advised)
+            # Idea 2: We modify this code for the build
+            if partial_path.startswith("HBEngine"):
+                absolute_path = partial_path.replace("HBEngine", f"{self.root_dir}/HBEngine")
+            else:
+                absolute_path = self.project_dir + "/" + partial_path
+
+            self.absolute_paths[partial_path] = absolute_path
+            if self.asset_pack and self.asset_pack.Contains(partial_path):
+                self.packed_paths[absolute_path] = partial_path
+
+        return absolute_path
+
+    def OpenAsset(self, absolute_path):
+        """
+        Returns a binary file object for the provided absolute asset path. Assets stored in the asset pack are read
+        from the pack, otherwise the file is opened from disk
+        """
+        if absolute_path in self.packed_paths:
+            return self.asset_pack.Open(self.packed_paths[absolute_path])
+        return open(absolute_path, "rb")
+
+    def AssetExists(self, absolute_path) -> bool:
+        """ Returns whether the provided absolute asset path exists, either in the asset pack or on disk """
+        return absolute_path in self.packed_paths or os.path.isfile(absolute_path)
+
+    def FindAssetPaths(self, data) -> list:
+        """ Returns the partial path of every asset referenced in the provided data, including any nested data """
+        asset_paths = []
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, str):
+                    # Empty values and 'None' are used for optional assets that aren't provided
+                    if key.endswith(self.asset_key_suffixes) and value and value != "None":
+                        asset_paths.append(value)
+                else:
+                    asset_paths.extend(self.FindAssetPaths(value))
+        elif isinstance(data, (list, tuple)):
+            for value in data:
+                asset_paths.extend(self.FindAssetPaths(value))
+
+        return asset_paths
+
+    def ReportMissingAssets(self, data, source) -> list:
+        """
+        Convert every asset path referenced in the provided data ahead of time, and report any that don't exist. This
+        allows missing files to be caught when data is loaded, instead of when the asset is first used. Returns the
+        list of missing partial paths
+        """
+        missing_paths = []
+        for partial_path in dict.fromkeys(self.FindAssetPaths(data)):
+            if not self.AssetExists(self.ConvertPartialToAbsolutePath(partial_path)):
+                missing_paths.append(partial_path)
+                print(f"Warning: '{source}' references a file that does not exist: '{partial_path}'")
 
+        return missing_paths
@@ -23,26 +23,29 @@ class fade_in(Transition):
         self.goal = 256
 
     def Start(self):
-        # Start the fade in at 0 opacity
-        self.renderable.GetSurface().set_alpha(0)
-        self.scene.Draw()
+        # Start the fade in at 0 opacity. The scene beneath the renderable is cached for the duration of the fade
+        self.scene.BeginFade(self.renderable)
+        self.renderable.SetAlpha(0)
+        self.scene.RequestDraw()
 
     def Update(self):
         self.progress += (self.speed * self.scene.delta_time)
-        self.renderable.GetSurface().set_alpha(self.progress)
+        self.renderable.SetAlpha(self.progress)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
 
         if self.progress >= self.goal:
             print("Transition Complete")
+            self.scene.EndFade(self.renderable)
             self.complete = True
         # TODO: If you have an unload and load action next to eachother withou a pause, and those two actions refer to
         # TODO: the same key, they'll attempt to overrid eachother. We need a function for "wait" that works alongside
         # TODO: "wait_for_input"
 
     def Skip(self):
-        self.renderable.GetSurface().set_alpha(self.goal)
-        self.scene.Draw()
+        self.renderable.SetAlpha(self.goal)
+        self.scene.EndFade(self.renderable)
+        self.scene.RequestDraw()
         self.complete = True
 
 class fade_out(Transition):
@@ -52,19 +55,25 @@ class fade_out(Transition):
         self.progress = self.renderable.GetSurface().get_alpha()
         self.goal = 0
 
+    def Start(self):
+        # The scene beneath the renderable is cached for the duration of the fade
+        self.scene.BeginFade(self.renderable)
+
     def Update(self):
         self.progress -= (self.speed * self.scene.delta_time)
-        self.renderable.GetSurface().set_alpha(self.progress)
+        self.renderable.SetAlpha(self.progress)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
 
         if self.progress <= self.goal:
             print("Transition Complete")
+            self.scene.EndFade(self.renderable)
             self.complete = True
 
     def Skip(self):
-        self.renderable.GetSurface().set_alpha(self.goal)
-        self.scene.Draw()
+        self.renderable.SetAlpha(self.goal)
+        self.scene.EndFade(self.renderable)
+        self.scene.RequestDraw()
         self.complete = True
 
 class text_loading(Transition):
@@ -78,16 +87,16 @@ class text_loading(Transition):
 
     def Update(self):
         self.progress -= (self.speed * self.scene.delta_time)
-        self.renderable.GetSurface().set_alpha(self.progress)
+        self.renderable.SetAlpha(self.progress)
 
-        self.scene.Draw()
+        self.scene.RequestDraw()
 
         if self.progress <= self.goal:
             print("Transition Complete")
             self.complete = True
 
     def Skip(self):
-        self.renderable.GetSurface().set_alpha(self.goal)
-        self.scene.Draw()
+        self.renderable.SetAlpha(self.goal)
+        self.scene.RequestDraw()
         self.complete = True
 
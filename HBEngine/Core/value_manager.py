@@ -12,8 +12,7 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
-import inspect
-from HBEngine.Core import actions
+from HBEngine.Core.action_manager import action_registry, GetRegistered
 
 
 class ValueManager:
@@ -43,16 +42,4 @@ class ValueManager:
         """
         Returns the object associated with the provided action text
         """
-        # Get a list of the action objects in the form of a list of tuples (object_name, object),
-        # and use the given action text as a lookup for an action in the list. If found, return it, otherwise
-        # return None
-        available_actions = inspect.getmembers(actions, inspect.isclass)
-
-        for action, object_ref in available_actions:
-            if action_name == action:
-                return object_ref
-
-        print("The provided action name is invalid. Please review the available actions, or add a new action function "
-              "for the one provided")
-        return None
-
+        return GetRegistered(action_registry, action_name, "action")
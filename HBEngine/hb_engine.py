@@ -13,28 +13,71 @@
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
 import argparse
+import os
+import time
 import pygame
 from HBEngine.Core.scene_manager import SceneManager
 from HBEngine.Core.settings import Settings
+from HBEngine.Core.input_script import InputScript
+from HBEngine.Core.input_router import InputRouter
+from HBEngine.Core.frame_profiler import FrameProfiler
+from HBEngine.Core.asset_cache import AssetCache
 from pygame import mixer
 
 
 class HBEngine:
-    def __init__(self, project_path):
+    def __init__(self, project_path, headless=False, frame_limit=None, timestep=1 / 60, input_script=None,
+                 profile_dump=None):
         #@TODO: What is the right way to handle this?
         if not project_path:
             print("Warning: No project path provided - Defaulting to the engine root")
 
+        # Headless mode runs without a display or audio device, as fast as possible using a fixed simulated timestep.
+        # Input is provided by an optional input script instead of the player. This is intended for benchmarking and
+        # automated testing, where runs need to be reproducible
+        self.headless = headless
+        self.frame_limit = frame_limit
+        self.timestep = timestep
+        self.input_script = None
+        self.profile_dump = profile_dump
+
+        if self.headless:
+            # SDL reads these when the display and mixer are initialized, so they need to be set beforehand
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+            if input_script:
+                self.input_script = InputScript(input_script)
+        elif input_script:
+            print("Warning: Input scripts are only played back in headless mode - Ignoring the provided input script")
+
+        # Audio is timed on the simulated clock as well, so sound actions complete on the same frame on every run
+        Settings.getInstance().headless = self.headless
+
         Settings.getInstance().SetProjectRoot(project_path)
         Settings.getInstance().Evaluate(Settings.getInstance().project_dir + "/Config/Game.yaml")
+        Settings.getInstance().ReportMissingAssets(Settings.getInstance().project_settings, "Config/Game.yaml")
 
         pygame.display.set_caption(Settings.getInstance().project_settings['Game']['title'])
 
         # Declare the scene manager, but we'll initialize it during the game loop
         self.scene_manager = None
+        self.is_running = False
 
         # DEBUG TRIGGERS
-        self.show_fps = False
+        self.show_profiler = False
+
+        # Frame pacing. When nothing is animating, the loop sleeps until the player does something instead of running
+        # at the full frame rate. When the window loses focus, the frame rate is throttled heavily. 'idle_timeout' (ms)
+        # caps how long an idle loop sleeps before re-checking its state
+        self.frame_rate = 60
+        self.unfocused_frame_rate = 10
+        self.idle_timeout = 500
+        self.has_focus = True
+
+        # The highest number of scene composites performed in a single frame. Drawing is coalesced, so this should
+        # never exceed 1
+        self.max_draws_per_frame = 0
 
     def Main(self):
 
@@ -43,48 +86,164 @@ class HBEngine:
         clock = pygame.time.Clock()
         window = pygame.display.set_mode(Settings.getInstance().active_resolution)
 
+        load_start = time.perf_counter()
+        AssetCache.getInstance().PreloadProjectFonts()
         self.scene_manager = SceneManager(window)
+        load_time = time.perf_counter() - load_start
+
+        # System input is handled ahead of the scene
+        self.SubscribeSystemInput()
 
         # Start the game loop
-        is_running = True
-        while is_running is True:
-            events = pygame.event.get()
-
-            # Handle all system actions
-            for event in events:
-                if event.type == pygame.QUIT:
-                    is_running = False
-                if event.type == pygame.KEYDOWN:
-                    # Maximize
-                    if event.key == pygame.K_1:
-                        self.UpdateResolution(1, pygame.FULLSCREEN)
-                        self.scene_manager.ResizeScene()
-                    # Minimize
-                    if event.key == pygame.K_2:
-                        self.UpdateResolution(0)
-                        self.scene_manager.ResizeScene()
-                    # Exit
-                    if event.key == pygame.K_ESCAPE:
-                        is_running = False
-                    if event.type == pygame.QUIT:
-                        is_running = False
-                    # Debug - FPS
-                    if event.key == pygame.K_F3:
-                        self.show_fps = not self.show_fps
+        frame = 0
+        loop_start = time.perf_counter()
+        self.is_running = True
+        while self.is_running is True:
+            events = []
+            if not self.headless and self.IsIdle():
+                # Block until an event arrives, or until the next sleeping action is due. Anything that would make the
+                # scene change is either an event or an awake action, so there is nothing to update in the meantime
+                a_manager = self.scene_manager.active_scene.a_manager
+                timeout = self.idle_timeout
+                time_until_wakeup = a_manager.GetTimeUntilWakeup()
+                if time_until_wakeup is not None:
+                    timeout = min(timeout, int(time_until_wakeup * 1000) + 1)
+
+                event = pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+
+                # Discard the time spent waiting so it isn't applied to the next frame's delta time. Sleeping actions
+                # are still owed it, so they wake on time
+                a_manager.AdvanceTime(clock.tick() / 1000)
+
+            FrameProfiler.getInstance().BeginFrame()
+
+            events.extend(pygame.event.get())
+            if self.input_script:
+                events.extend(self.input_script.GetEvents(frame))
+
+            # Route each event to the systems subscribed to it
+            events = InputRouter.getInstance().Dispatch(events)
+
+            FrameProfiler.getInstance().Mark("events")
 
             # Update scene logic. This drives the core game functionality
             self.scene_manager.active_scene.Update(events)
 
-            # Debug Logging
-            if self.show_fps:
-                print(clock.get_fps())
+            # Composite the scene at most once per frame, after all logic has had a chance to request a draw. The
+            # scene may have been switched during the update, so always re-acquire it
+            scene = self.scene_manager.active_scene
+            if self.show_profiler and FrameProfiler.getInstance().overlay_rect:
+                # The overlay is drawn on top of the scene, so the area beneath it needs to be refreshed each frame
+                scene.MarkDirty(FrameProfiler.getInstance().overlay_rect)
+            if scene.draw_requested:
+                scene.Draw()
+
+            self.max_draws_per_frame = max(self.max_draws_per_frame, scene.draw_count)
+            scene.draw_count = 0
+
+            # Refresh any changes. Only the areas of the window that were recomposited need to be pushed
+            update_rects = scene.FlushUpdateRects()
+            if self.show_profiler:
+                cache_stats = AssetCache.getInstance().GetStats()
+                update_rects.append(
+                    FrameProfiler.getInstance().DrawOverlay(
+                        window,
+                        [
+                            f"FPS: {clock.get_fps():.1f}",
+                            f"Max Draws Per Frame: {self.max_draws_per_frame}",
+                            f"Asset Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                            f"{cache_stats['bytes'] / (1024 * 1024):.1f}MB"
+                        ]
+                    )
+                )
+            FrameProfiler.getInstance().Mark("draw")
 
-            # Refresh any changes
-            pygame.display.update()
+            if update_rects:
+                pygame.display.update(update_rects)
+            FrameProfiler.getInstance().Mark("display")
+            FrameProfiler.getInstance().EndFrame()
 
             # Get the time in miliseconds converted to seconds since the last frame. Used to avoid frame dependency
-            # on actions
-            self.scene_manager.active_scene.delta_time = clock.tick(60) / 1000
+            # on actions. Headless runs simulate a fixed timestep instead, and don't cap the frame rate
+            if self.headless:
+                self.scene_manager.active_scene.delta_time = self.timestep
+            elif self.has_focus:
+                self.scene_manager.active_scene.delta_time = clock.tick(self.frame_rate) / 1000
+            else:
+                self.scene_manager.active_scene.delta_time = clock.tick(self.unfocused_frame_rate) / 1000
+
+            frame += 1
+            if self.frame_limit and frame >= self.frame_limit:
+                self.is_running = False
+
+        # Preloads for scenes that will never be switched to shouldn't keep the process alive
+        self.scene_manager.Shutdown()
+
+        if self.headless:
+            run_time = time.perf_counter() - loop_start
+            print(f"Headless run complete - Frames: {frame} | Scene Load: {load_time * 1000:.2f}ms | "
+                  f"Total: {run_time * 1000:.2f}ms | Average Frame: {run_time * 1000 / max(frame, 1):.3f}ms")
+            print(f"Asset Cache: {AssetCache.getInstance().GetStats()}")
+
+        if self.profile_dump:
+            FrameProfiler.getInstance().Dump(self.profile_dump)
+
+    def SubscribeSystemInput(self):
+        """ Subscribe to the events handled by the engine itself. These take priority over any scene input """
+        router = InputRouter.getInstance()
+        router.Subscribe(pygame.QUIT, self.Quit, priority=100, owner=self)
+        router.Subscribe(pygame.WINDOWFOCUSLOST, self.OnFocusChanged, priority=100, owner=self)
+        router.Subscribe(pygame.WINDOWFOCUSGAINED, self.OnFocusChanged, priority=100, owner=self)
+
+        # Maximize
+        router.SubscribeBinding("fullscreen", pygame.KEYDOWN, self.OnFullscreen, priority=100, owner=self)
+        # Minimize
+        router.SubscribeBinding("windowed", pygame.KEYDOWN, self.OnWindowed, priority=100, owner=self)
+        # Exit
+        router.SubscribeBinding("exit", pygame.KEYDOWN, self.Quit, priority=100, owner=self)
+        # Debug - Frame Profiler
+        router.SubscribeBinding("toggle_profiler", pygame.KEYDOWN, lambda event: self.ToggleProfilerOverlay(),
+                                priority=100, owner=self)
+        router.SubscribeBinding("dump_profile", pygame.KEYDOWN, lambda event: self.DumpProfile(),
+                                priority=100, owner=self)
+
+    def Quit(self, event):
+        self.is_running = False
+
+    def OnFocusChanged(self, event):
+        self.has_focus = event.type == pygame.WINDOWFOCUSGAINED
+
+    def OnFullscreen(self, event):
+        self.UpdateResolution(1, pygame.FULLSCREEN)
+        self.scene_manager.ResizeScene()
+
+    def OnWindowed(self, event):
+        self.UpdateResolution(0)
+        self.scene_manager.ResizeScene()
+
+    def IsIdle(self) -> bool:
+        """
+        Returns whether the active scene has nothing to animate or draw, meaning the loop can sleep. Sleeping actions
+        don't prevent this, as the loop wakes in time for them
+        """
+        scene = self.scene_manager.active_scene
+        return not scene.a_manager.HasAwakeActions() and not scene.draw_requested and not self.show_profiler
+
+    def ToggleProfilerOverlay(self):
+        """ Show or hide the frame profiler overlay """
+        self.show_profiler = not self.show_profiler
+
+        # Refresh the area the overlay was covering so it doesn't linger
+        if not self.show_profiler and FrameProfiler.getInstance().overlay_rect:
+            self.scene_manager.active_scene.MarkDirty(FrameProfiler.getInstance().overlay_rect)
+
+    def DumpProfile(self):
+        """ Write the recorded frame profile to the project directory as both JSON and CSV """
+        file_name = f"{Settings.getInstance().project_dir}/frame_profile_{time.strftime('%Y%m%d_%H%M%S')}"
+        FrameProfiler.getInstance().Dump(file_name + ".json")
+        FrameProfiler.getInstance().Dump(file_name + ".csv")
 
     def UpdateResolution(self, new_size_index, flag=0):
         # Use the given, but always add HWSURFACE and DOUBLEBUF
@@ -92,12 +251,30 @@ class HBEngine:
             Settings.getInstance().resolution = new_size_index
             pygame.display.set_mode(Settings.getInstance().resolution_options[new_size_index], flag)
 
-            self.scene_manager.active_scene.Draw()
+            self.scene_manager.active_scene.RequestFullRedraw()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-p", "--project_path", type=str, nargs="?", const="", help="A file path for a HBEngine Project")
+    parser.add_argument("--headless", action="store_true", help="Run without a display or audio device, as fast as "
+                                                                "possible using a fixed timestep")
+    parser.add_argument("--frames", type=int, default=600, help="The number of frames to run in headless mode")
+    parser.add_argument("--timestep", type=float, default=1 / 60, help="The simulated seconds per frame in headless "
+                                                                       "mode")
+    parser.add_argument("--input_script", type=str, help="A file path for a YAML input script to play back in "
+                                                         "headless mode")
+    parser.add_argument("--profile_dump", type=str, help="A file path to write the frame profile to on exit "
+                                                         "('.json' or '.csv')")
     args = parser.parse_args()
+    if args.input_script and not args.headless:
+        parser.error("--input_script requires --headless")
     print(args)
-    engine = HBEngine(args.project_path)
+    engine = HBEngine(
+        args.project_path,
+        args.headless,
+        args.frames if args.headless else None,
+        args.timestep,
+        args.input_script,
+        args.profile_dump
+    )
     engine.Main()
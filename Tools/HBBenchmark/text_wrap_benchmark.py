@@ -0,0 +1,141 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import os
+import random
+import timeit
+
+# Text rendering requires an initialized display, but there's no need for a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from HBEngine.Core.BaseClasses.renderable_text import TextRenderable
+
+"""
+A micro-benchmark for 'TextRenderable.WrapText', comparing it against the original character-by-character line
+scan. Both are run against generated paragraphs, and their output is checked to be identical
+
+Run from the repository root:
+    python -m Tools.HBBenchmark.text_wrap_benchmark
+"""
+
+
+class BenchmarkScene:
+    """ The minimal scene interface required to construct renderables outside of the engine """
+    def __init__(self):
+        self.resolution_multiplier = 1
+
+    def MarkDirty(self, rect, renderable=None):
+        pass
+
+
+def LegacyFindLineBreak(font_obj, line, max_width) -> int:
+    """ The original line break scan, which measures every prefix of the line one character at a time """
+    i = 1
+    while font_obj.size(line[:i])[0] < max_width and i < len(line):
+        i += 1
+
+    if i < len(line):
+        i = line.rfind(" ", 0, i) + 1
+
+    return i
+
+
+def GenerateParagraph(length, seed) -> str:
+    """ Generate a paragraph of random words with the provided character length """
+    rng = random.Random(seed)
+    words = []
+    while sum(len(word) + 1 for word in words) < length:
+        words.append("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(1, 12))))
+
+    return " ".join(words)[:length]
+
+
+def CreateRenderable(text, font, size) -> TextRenderable:
+    return TextRenderable(
+        BenchmarkScene(),
+        {
+            "key": "Benchmark",
+            "position": (0, 0),
+            "center_align": False,
+            "z_order": 0,
+            "text": text,
+            "text_color": (255, 255, 255),
+            "text_size": 24,
+            "font": font,
+            "size": size
+        }
+    )
+
+
+def Main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--length", type=int, default=1000, help="The character length of each paragraph")
+    parser.add_argument("--paragraphs", type=int, default=20, help="The number of paragraphs to wrap")
+    parser.add_argument("--width", type=int, default=1000, help="The wrap width in pixels")
+    parser.add_argument("--font", type=str, default="HBEngine/Content/Fonts/Comfortaa/Comfortaa-Regular.ttf")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    # The height is large enough to never truncate the paragraph, so every line is processed
+    size = (args.width, 10000)
+    paragraphs = [GenerateParagraph(args.length, seed) for seed in range(args.paragraphs)]
+    renderable = CreateRenderable(paragraphs[0], args.font, size)
+    font_obj = renderable.font_obj
+
+    # Verify both approaches choose the same breaks before comparing their speed. When no whitespace fits, the legacy
+    # scan returns 0 and never progresses, so only breaks it was able to make are compared
+    for paragraph in paragraphs:
+        legacy_breaks = []
+        breaks = []
+        line = paragraph
+        while line:
+            legacy_breaks.append(LegacyFindLineBreak(font_obj, line, args.width))
+            breaks.append(renderable.FindLineBreak(line, args.width))
+            if legacy_breaks[-1] != 0 and legacy_breaks[-1] != breaks[-1]:
+                raise AssertionError(f"Line breaks differ: {legacy_breaks} != {breaks}")
+            line = line[breaks[-1]:]
+
+    def RunLegacy():
+        for paragraph in paragraphs:
+            line = paragraph
+            while line:
+                line = line[max(LegacyFindLineBreak(font_obj, line, args.width), 1):]
+
+    def RunCurrent():
+        for paragraph in paragraphs:
+            line = paragraph
+            while line:
+                line = line[renderable.FindLineBreak(line, args.width):]
+
+    def RunWrapText():
+        for paragraph in paragraphs:
+            renderable.text = paragraph
+            renderable.WrapText(pygame.Surface(size, pygame.SRCALPHA))
+
+    legacy_time = min(timeit.repeat(RunLegacy, number=1, repeat=3)) / len(paragraphs)
+    current_time = min(timeit.repeat(RunCurrent, number=1, repeat=3)) / len(paragraphs)
+    wrap_time = min(timeit.repeat(RunWrapText, number=1, repeat=3)) / len(paragraphs)
+
+    print(f"Paragraphs: {len(paragraphs)} x {args.length} characters, wrapped at {args.width}px")
+    print(f"Legacy line breaking:  {legacy_time * 1000:.3f}ms per paragraph")
+    print(f"Current line breaking: {current_time * 1000:.3f}ms per paragraph ({legacy_time / current_time:.1f}x)")
+    print(f"Full WrapText (Including rendering): {wrap_time * 1000:.3f}ms per paragraph")
+
+
+if __name__ == "__main__":
+    Main()
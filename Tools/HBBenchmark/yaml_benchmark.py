@@ -0,0 +1,116 @@
+"""
+    The Heartbeat Engine is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    The Heartbeat Engine is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import glob
+import random
+import timeit
+import yaml
+from Tools.HBYaml import hb_yaml
+
+"""
+A benchmark comparing the pure Python and libyaml backends used by 'Tools.HBYaml'. Both loading and dumping are timed
+against every YAML file in the sample projects, as well as a large generated dialogue scene. The output of both
+backends is checked to be identical before comparing their speed
+
+Run from the repository root:
+    python -m Tools.HBBenchmark.yaml_benchmark
+"""
+
+
+def GenerateDialogueScene(entry_count, seed) -> dict:
+    """ Generate a dialogue scene with the provided number of entries, spread across a handful of branches """
+    rng = random.Random(seed)
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(1, 12))) for _ in range(500)]
+    branches = {}
+
+    for branch_index in range(10):
+        entries = []
+        for entry_index in range(entry_count // 10):
+            entries.append({
+                "action": "dialogue",
+                "speaker": {
+                    "key": "SpeakerText",
+                    "text": rng.choice(words).capitalize(),
+                    "text_color": [rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)],
+                    "transition": {"type": "fade_in", "speed": 500}
+                },
+                "dialogue": {
+                    "key": "DialogueText",
+                    "text": " ".join(rng.choice(words) for _ in range(rng.randint(5, 40))),
+                    "transition": {"type": "fade_in", "speed": 500}
+                },
+                "post_wait": "wait_for_input"
+            })
+        branches[f"Branch_{branch_index}"] = {"description": f"Generated branch {branch_index}", "entries": entries}
+
+    return {"type": "Scene_Dialogue", "dialogue": branches}
+
+
+def TimeBackends(name, documents, repeat):
+    """ Print the load and dump times of both backends for the provided YAML documents """
+    backends = {"Pure Python": (yaml.SafeLoader, hb_yaml.PureDumper)}
+    if yaml.__with_libyaml__:
+        backends["libyaml"] = (yaml.CSafeLoader, hb_yaml.FastDumper)
+
+    # Verify the backends agree before comparing them
+    outputs = {}
+    for backend_name, (loader, dumper) in backends.items():
+        data = [yaml.load(document, Loader=loader) for document in documents]
+        outputs[backend_name] = (data, [yaml.dump(entry, Dumper=dumper, sort_keys=False) for entry in data])
+    if len(set(repr(output) for output in outputs.values())) > 1:
+        raise AssertionError(f"The YAML backends produced different output for '{name}'")
+
+    print(f"{name} ({len(documents)} documents, {sum(len(document) for document in documents) / 1024:.1f}KB)")
+    times = {}
+    for backend_name, (loader, dumper) in backends.items():
+        data = outputs[backend_name][0]
+        load_time = min(timeit.repeat(
+            lambda: [yaml.load(document, Loader=loader) for document in documents], number=1, repeat=repeat
+        ))
+        dump_time = min(timeit.repeat(
+            lambda: [yaml.dump(entry, Dumper=dumper, sort_keys=False) for entry in data], number=1, repeat=repeat
+        ))
+        times[backend_name] = (load_time, dump_time)
+        print(f"    {backend_name:<12} Load: {load_time * 1000:9.2f}ms | Dump: {dump_time * 1000:9.2f}ms")
+
+    if "libyaml" in times:
+        pure_load, pure_dump = times["Pure Python"]
+        fast_load, fast_dump = times["libyaml"]
+        print(f"    {'Speedup':<12} Load: {pure_load / fast_load:8.1f}x | Dump: {pure_dump / fast_dump:8.1f}x")
+    else:
+        print("    libyaml is not available - Only the pure Python backend was timed")
+
+
+def Main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=1000, help="The number of entries in the generated scene")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of times to repeat each measurement")
+    args = parser.parse_args()
+
+    sample_documents = []
+    for file_path in sorted(glob.glob("SampleProjects/**/*.yaml", recursive=True)):
+        with open(file_path) as f:
+            sample_documents.append(f.read())
+
+    TimeBackends("Sample Projects", sample_documents, args.repeat)
+    TimeBackends(
+        f"Generated Scene ({args.entries} entries)",
+        [yaml.dump(GenerateDialogueScene(args.entries, 0), sort_keys=False)],
+        args.repeat
+    )
+
+
+if __name__ == "__main__":
+    Main()
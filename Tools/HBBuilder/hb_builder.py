@@ -16,6 +16,7 @@ import subprocess
 import os
 import shutil
 import time
+from HBEngine.Core.asset_pack import AssetPack
 
 
 class HBBuilder:
@@ -31,17 +32,36 @@ class HBBuilder:
         # Remove the build folder if it exists, just in case the state changed significantly
         HBBuilder.Clean(logger, build_dir)
 
+        # Pack the content into a single asset pack, instead of shipping thousands of loose files. YAML data files are
+        # still shipped loose, so stage them separately
+        staging_dir = f"{working_dir}/staging"
+        HBBuilder.StageDataFiles(f"{project_dir}/Content", f"{staging_dir}/Content")
+        engine_data_count = HBBuilder.StageDataFiles(f"{engine_dir}/Content", f"{staging_dir}/HBEngine/Content")
+
+        logger.Log(f"Packing assets...")
+        packed_count = AssetPack.Build(
+            f"{staging_dir}/Assets.hbpack",
+            {
+                f"{project_dir}/Content": "Content",
+                f"{engine_dir}/Content": "HBEngine/Content"
+            },
+            (".yaml",)
+        )
+        logger.Log(f"Packed {packed_count} assets")
+
         # Use a subprocess call to invoke PyInstaller so it can fail independently
         args = f"venv/Scripts/pyinstaller.exe " \
                "--noconsole " \
                f"--workpath \"{working_dir}\" "\
                f"--distpath \"{output_dir}\" "\
                f"--specpath \"{working_dir}\" "\
-               f"--add-data \"{project_dir}/Content;Content\" "\
-               f"--add-data \"{project_dir}/Config;Config\" "\
-               f"--add-data \"{engine_dir}/Content;HBEngine/Content\" "\
-               f"--name \"{project_name}\" "\
-               f"HBEngine/hb_engine.py"
+               f"--add-data \"{staging_dir}/Assets.hbpack;.\" "\
+               f"--add-data \"{staging_dir}/Content;Content\" "\
+               f"--add-data \"{project_dir}/Config;Config\" "
+        if engine_data_count:
+            args += f"--add-data \"{staging_dir}/HBEngine/Content;HBEngine/Content\" "
+        args += f"--name \"{project_name}\" "\
+                f"HBEngine/hb_engine.py"
 
         logger.Log(f"Generating executable...")
         result = subprocess.Popen(
@@ -57,6 +77,25 @@ class HBBuilder:
         else:
             logger.Log("*** BUILD FAILED ***", 4)
 
+    @staticmethod
+    def StageDataFiles(source_dir: str, target_dir: str) -> int:
+        """
+        Copy the YAML data files in the provided directory to the target directory, preserving the folder structure.
+        Returns the number of files copied
+        """
+        os.makedirs(target_dir, exist_ok=True)
+
+        file_count = 0
+        for root, dirs, files in os.walk(source_dir):
+            for file_name in files:
+                if file_name.lower().endswith(".yaml"):
+                    target_path = os.path.join(target_dir, os.path.relpath(os.path.join(root, file_name), source_dir))
+                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                    shutil.copy2(os.path.join(root, file_name), target_path)
+                    file_count += 1
+
+        return file_count
+
     @staticmethod
     def Clean(logger, project_dir: str):
         """ Deletes the active project's build directory """
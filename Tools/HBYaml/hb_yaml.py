@@ -12,15 +12,111 @@
     You should have received a copy of the GNU General Public License
     along with the Heartbeat Engine. If not, see <https://www.gnu.org/licenses/>.
 """
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
 import yaml
 
 
+def RepresentTuple(dumper, data):
+    """ Write tuples as plain sequences, as the safe dumpers only support standard YAML types """
+    return dumper.represent_list(data)
+
+
+class PureDumper(yaml.SafeDumper):
+    pass
+
+
+PureDumper.add_representer(tuple, RepresentTuple)
+
+# Use the libyaml-backed loader and dumper when available, as they're many times faster than the pure Python versions.
+# Both produce the same data and output, so the pure Python versions are used as a fallback
+if yaml.__with_libyaml__:
+    class FastDumper(yaml.CSafeDumper):
+        pass
+
+    FastDumper.add_representer(tuple, RepresentTuple)
+
+    Loader = yaml.CSafeLoader
+    Dumper = FastDumper
+else:
+    Loader = yaml.SafeLoader
+    Dumper = PureDumper
+
+
+def GetUserCacheDir() -> str:
+    """
+    Returns the per-user directory that parsed data files are cached in. Cache entries are unpickled when loaded,
+    which can run arbitrary code, so they're only ever read from a directory written by the current user, and never
+    from a project directory (Which may have been shared or downloaded)
+    """
+    if sys.platform == "win32":
+        base_dir = os.environ.get("LOCALAPPDATA", os.path.expanduser("~/AppData/Local"))
+    elif sys.platform == "darwin":
+        base_dir = os.path.expanduser("~/Library/Caches")
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+
+    return os.path.join(base_dir, "HeartbeatEngine", "DataCache").replace("\\", "/")
+
+
 class Reader:
     @staticmethod
-    def ReadAll(file_path: str):
-        """ Given a file path, read in the contents of the file and return them """
-        with open(file_path) as f:
-            return yaml.load(f, Loader=yaml.FullLoader)
+    def ReadAll(file_path: str, cache_dir: str = None):
+        """
+        Given a file path, read in the contents of the file and return them. If 'cache_dir' is provided, the parsed
+        contents are cached there in binary form, and are reused for as long as the file contents are unchanged
+
+        Cache entries are pickles, and loading a pickle can run arbitrary code. Only provide a directory that is private
+        to the current user (See 'GetUserCacheDir'), never one that is distributed with a project
+        """
+        if not cache_dir:
+            with open(file_path) as f:
+                return yaml.load(f, Loader=Loader)
+
+        with open(file_path, "rb") as f:
+            contents = f.read()
+
+        # Each file has a single cache entry, keyed by its absolute path, which stores the hash of the contents it was
+        # parsed from. Hashing the contents (Rather than relying on modification times) means a file being written
+        # while it's read can never be matched with a stale entry
+        contents_hash = hashlib.sha1(contents).hexdigest()
+        cache_file = os.path.join(cache_dir, hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest() + ".pickle")
+        try:
+            with open(cache_file, "rb") as f:
+                cached_hash, data = pickle.load(f)
+            if cached_hash == contents_hash:
+                return data
+        except Exception:
+            # The entry is missing, or is unreadable. Either way, re-parse and replace it
+            pass
+
+        data = yaml.load(contents, Loader=Loader)
+        Reader.WriteCache(cache_file, (contents_hash, data))
+
+        return data
+
+    @staticmethod
+    def WriteCache(cache_file: str, cache_data):
+        """
+        Write a cache entry. Entries are written to a temporary file first, then moved into place, so other processes
+        never read a partially written entry. Failing to write the cache isn't an error, as it's only an optimization
+        """
+        cache_dir = os.path.dirname(cache_file)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(temp_fd, "wb") as f:
+                    pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_file)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as exc:
+            print(f"Unable to write YAML cache file '{cache_file}': {exc}")
 
 
 class Writer:
@@ -37,5 +133,4 @@ class Writer:
             # By default, yaml dumps data in a 'sorted order' instead of by 'insertion order'. As per this:
             # https://github.com/yaml/pyyaml/issues/110, you can specify 'sort_keys=False' to force the dump to
             # skip the sorting and use insertion order
-            return yaml.dump(data, file, sort_keys=False)
-
+            return yaml.dump(data, file, Dumper=Dumper, sort_keys=False)